@@ -3,56 +3,55 @@ Convert TXT file with Spanish addresses to CSV format.
 """
 
 import csv
+import re
 from pathlib import Path
 
+# A comma-separated field that is exactly a 5-digit zip code
+_ZIP_RE = re.compile(r"(?:^|,)\s*(\d{5})\s*(?:,|$)")
+
 
 def convert_txt_to_csv(txt_path: Path, csv_path: Path) -> None:
-    """Convert address TXT file to proper CSV format."""
-    records = []
-
-    with open(txt_path, "r", encoding="utf-8") as f:
-        lines = f.readlines()
-
-    # Skip header line
-    for line in lines[1:]:
-        line = line.strip()
-        if not line:
-            continue
-
-        # Split by comma, but be careful: address and notes may contain commas
-        # Format: address,city,zip,notes
-        # Strategy: split and take first part as address, then city, zip, rest as notes
-        parts = line.split(",")
-
-        if len(parts) >= 3:
-            # Find the zip code (should be 5 digits) to properly split
-            # Work backwards from parts to find zip code
-            zip_idx = None
-            for i, part in enumerate(parts):
-                if part.strip().isdigit() and len(part.strip()) == 5:
-                    zip_idx = i
-                    break
-
-            if zip_idx and zip_idx >= 2:
-                address = ",".join(parts[:zip_idx - 1]).strip()
-                city = parts[zip_idx - 1].strip()
-                zip_code = parts[zip_idx].strip()
-                notes = ",".join(parts[zip_idx + 1:]).strip() if len(parts) > zip_idx + 1 else ""
-
-                records.append({
-                    "address": address,
-                    "city": city,
-                    "zip": zip_code,
-                    "notes": notes
-                })
-
-    # Save to CSV
-    with open(csv_path, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["address", "city", "zip", "notes"])
-        writer.writeheader()
-        writer.writerows(records)
-
-    print(f"Converted {len(records)} records from {txt_path} to {csv_path}")
+    """Convert address TXT file to proper CSV format.
+
+    Streams the input line by line and writes each record as it is found,
+    so memory use does not grow with file size.
+    """
+    num_records = 0
+
+    with (
+        open(txt_path, "r", encoding="utf-8") as f,
+        open(csv_path, "w", newline="", encoding="utf-8") as out,
+    ):
+        writer = csv.writer(out)
+        writer.writerow(["address", "city", "zip", "notes"])
+
+        # Skip header line
+        next(f, None)
+
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+
+            # Address and notes may contain commas
+            # Format: address,city,zip,notes
+            # Strategy: find the first 5-digit field, then split the part before
+            # it on its last comma into address and city; the rest is notes
+            match = _ZIP_RE.search(line)
+            if not match:
+                continue
+
+            head = line[:match.start()]
+            if "," not in head:
+                continue
+
+            address, city = head.rsplit(",", 1)
+            notes = line[match.end():].strip()
+
+            writer.writerow((address.strip(), city.strip(), match.group(1), notes))
+            num_records += 1
+
+    print(f"Converted {num_records} records from {txt_path} to {csv_path}")
 
 
 def main():
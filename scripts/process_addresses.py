@@ -7,13 +7,38 @@ Usage:
 """
 
 import argparse
+import logging
 import sys
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.pipeline import AddressPipeline
 
+logger = logging.getLogger("addrfix")
+
+
+def configure_logging() -> MemoryHandler:
+    """Send log records to stdout, buffered and flushed every 1000 records.
+
+    The buffer is also flushed on errors and at interpreter exit. Pipeline
+    progress messages are rare, so they go straight to stdout unbuffered.
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    buffered_handler = MemoryHandler(capacity=1000, target=stream_handler)
+    logger.addHandler(buffered_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+    pipeline_logger = logging.getLogger("src.pipeline")
+    pipeline_logger.addHandler(stream_handler)
+    pipeline_logger.setLevel(logging.INFO)
+    pipeline_logger.propagate = False
+    return buffered_handler
+
 
 def main():
     parser = argparse.ArgumentParser(description="Process addresses through validation pipeline")
@@ -40,7 +65,26 @@ def main():
         default=None,
         help="Limit number of rows to process",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes (each loads libpostal, ~2GB RAM); with --no-llm they run the whole validation",
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=32,
+        help="Number of LLM requests sent to the reviewer together (duplicates are generated once)",
+    )
+    parser.add_argument(
+        "--progress-every",
+        type=int,
+        default=10_000,
+        help="Log progress every N rows (0 to disable)",
+    )
     args = parser.parse_args()
+    log_handler = configure_logging()
 
     project_root = Path(__file__).parent.parent
     reference_dir = project_root / "data" / "reference" / "postal-codes"
@@ -52,21 +96,24 @@ def main():
     # Ensure output directory exists
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    print(f"Input: {input_path}")
-    print(f"Output: {output_path}")
-    print(f"LLM enabled: {not args.no_llm}")
+    logger.info("Input: %s", input_path)
+    logger.info("Output: %s", output_path)
+    logger.info("LLM enabled: %s", not args.no_llm)
     if args.limit:
-        print(f"Limit: {args.limit} rows")
+        logger.info("Limit: %d rows", args.limit)
+    if args.workers > 1:
+        logger.info("Workers: %d", args.workers)
 
     # Initialize pipeline
-    print("\nInitializing pipeline...")
+    logger.info("\nInitializing pipeline...")
     pipeline = AddressPipeline(
         reference_dir=reference_dir,
         use_llm=not args.no_llm,
     )
 
     # Process addresses
-    print("\nProcessing addresses...")
+    logger.info("\nProcessing addresses...")
+    log_handler.flush()  # Show the run configuration before the long step
     stats = pipeline.process_csv(
         input_path=input_path,
         output_path=output_path,
@@ -74,20 +121,23 @@ def main():
         city_col="city",
         postcode_col="zip",
         limit=args.limit,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        progress_every=args.progress_every,
     )
 
     # Print summary
-    print("\n" + "=" * 50)
-    print("SUMMARY")
-    print("=" * 50)
-    print(f"Total processed: {stats['total']}")
-    print(f"  Valid: {stats['valid']}")
-    print(f"  Valid (normalized): {stats['valid_normalized']}")
-    print(f"  Invalid (format): {stats['invalid_format']}")
-    print(f"  Invalid (mismatch): {stats['invalid_mismatch']}")
-    print(f"  Nonsense: {stats['nonsense']}")
-    print(f"  Needs review: {stats['needs_review']}")
-    print(f"\nOutput saved to: {output_path}")
+    logger.info("\n" + "=" * 50)
+    logger.info("SUMMARY")
+    logger.info("=" * 50)
+    logger.info("Total processed: %d", stats["total"])
+    logger.info("  Valid: %d", stats["valid"])
+    logger.info("  Valid (normalized): %d", stats["valid_normalized"])
+    logger.info("  Invalid (format): %d", stats["invalid_format"])
+    logger.info("  Invalid (mismatch): %d", stats["invalid_mismatch"])
+    logger.info("  Nonsense: %d", stats["nonsense"])
+    logger.info("  Needs review: %d", stats["needs_review"])
+    logger.info("\nOutput saved to: %s", output_path)
 
 
 if __name__ == "__main__":
@@ -3,10 +3,18 @@ Simple test script to verify the LLM model is working.
 Sends a "Hello" prompt and prints the response.
 """
 
+import sys
+from pathlib import Path
+
 from mlx_lm import load, generate
 
-# Use the same model as in flag-malformed.py
-MODEL_PATH = "mlx-community/Qwen2.5-7B-Instruct-4bit"
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.llm.reviewer import DEFAULT_MODEL_PATH
+
+# Use the same model as the address reviewer
+MODEL_PATH = DEFAULT_MODEL_PATH
+
 
 def main():
     print(f"Loading model: {MODEL_PATH}")
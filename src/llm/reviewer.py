@@ -6,12 +6,43 @@ Uses local Qwen model with Outlines for structured generation:
 2. Unknown city validation (language variations)
 """
 
+from collections.abc import Sequence
 from enum import Enum
-from typing import Literal
 
+import mlx.core as mx
 import outlines
 from mlx_lm import load
-from pydantic import BaseModel, Field
+from mlx_lm.models.cache import make_prompt_cache, trim_prompt_cache
+from outlines.types import Regex
+from pydantic import BaseModel, Field, ValidationError
+
+
+# Small 4-bit model: the task is a short constrained classification, and MLX
+# decode speed is bound by weight reads, so fewer weight bytes = faster decode
+DEFAULT_MODEL_PATH = "mlx-community/Qwen2.5-1.5B-Instruct-4bit"
+
+
+# Static instructions come first in each prompt so their KV cache can be
+# computed once and reused; only the per-call details are prefilled each time
+NONSENSE_INSTRUCTIONS = """Analyze a Spanish address input and classify the user's intent.
+
+Classifications:
+- valid_attempt: A genuine attempt to provide an address (typos/incomplete OK)
+- gibberish: Random characters, keyboard mashing, meaningless text
+- refusal: User refused to provide address (e.g., "No quiero", "No tengo")
+- test_data: Obvious test/placeholder data (e.g., "TEST", "PRUEBA")
+
+Answer in the format classification|confidence|reason, where confidence is high, medium or low.
+
+"""
+
+CITY_INSTRUCTIONS = """Decide if a city name is a valid name for a city in a Spanish province.
+
+Answer is_valid=true if the city name matches or is a variant of any reference city.
+Accept: exact matches, regional language variants, minor typos, missing accents.
+Answer is_valid=false only for fictional places or cities in a different Spanish province.
+
+"""
 
 
 class AddressIntent(str, Enum):
@@ -21,19 +52,25 @@ class AddressIntent(str, Enum):
     TEST_DATA = "test_data"
 
 
-class NonsenseCheckOutput(BaseModel):
-    """Structured output for nonsense detection."""
+# Length bounds on the free-text parts of the structured outputs
+NONSENSE_REASON_MAX_CHARS = 60
+CITY_NAME_MAX_CHARS = 50
+CITY_REASON_MAX_CHARS = 60
 
-    classification: Literal["valid_attempt", "gibberish", "refusal", "test_data"] = Field(
-        description="The intent classification"
-    )
-    confidence: Literal["high", "medium", "low"] = Field(
-        description="Confidence level"
-    )
-    reason: str = Field(
-        description="Brief explanation",
-        max_length=100
-    )
+# Structured output for nonsense detection: "classification|confidence|reason".
+# A tight regex keeps decoding to a handful of tokens instead of a JSON object.
+NONSENSE_OUTPUT = Regex(
+    r"(valid_attempt|gibberish|refusal|test_data)\|(high|medium|low)\|"
+    rf"[^|\n]{{0,{NONSENSE_REASON_MAX_CHARS}}}"
+)
+
+# Token budgets for constrained outputs, derived from the schema bounds.
+# Generation stops early at the end of the grammar, so the cap only bounds
+# runaway cases: it allows the fixed structure plus two tokens per free-text
+# character (accented and rare characters often take more than one token).
+# Longer answers can still be cut off; callers treat them as inconclusive.
+NONSENSE_MAX_TOKENS = 16 + 2 * NONSENSE_REASON_MAX_CHARS
+CITY_MAX_TOKENS = 32 + 2 * (CITY_NAME_MAX_CHARS + CITY_REASON_MAX_CHARS)
 
 
 class CityValidationOutput(BaseModel):
@@ -44,11 +81,11 @@ class CityValidationOutput(BaseModel):
     )
     normalized_city: str = Field(
         description="The official Spanish city name, or 'none' if invalid",
-        max_length=50
+        max_length=CITY_NAME_MAX_CHARS
     )
     reason: str = Field(
         description="Brief explanation",
-        max_length=100
+        max_length=CITY_REASON_MAX_CHARS
     )
 
 
@@ -73,7 +110,7 @@ class CityValidationResult:
 class AddressReviewer:
     """LLM-based reviewer for address edge cases using structured generation."""
 
-    def __init__(self, model_path: str = "mlx-community/Qwen2.5-7B-Instruct-4bit"):
+    def __init__(self, model_path: str = DEFAULT_MODEL_PATH):
         """Initialize the reviewer.
 
         Args:
@@ -85,19 +122,128 @@ class AddressReviewer:
         self._outlines_model = None
         self._nonsense_generator = None
         self._city_generator = None
+        self._prompt_prefix = ""
+        self._prompt_suffix = ""
+        self._nonsense_cache = None
+        self._city_cache = None
 
     def _ensure_loaded(self):
         """Lazy load the model and generators on first use."""
-        if self._model is None:
+        # The caches are set last, so a load that failed its checks is retried
+        if self._city_cache is None:
             self._model, self._tokenizer = load(self.model_path)
             self._outlines_model = outlines.from_mlxlm(self._model, self._tokenizer)
+            self._check_prompt_passthrough()
             self._nonsense_generator = outlines.Generator(
-                self._outlines_model, output_type=NonsenseCheckOutput
+                self._outlines_model, output_type=NONSENSE_OUTPUT
             )
             self._city_generator = outlines.Generator(
                 self._outlines_model, output_type=CityValidationOutput
             )
 
+            # Render the chat template once; only the user content varies
+            placeholder = "__PROMPT__"
+            template = self._tokenizer.apply_chat_template(
+                [{"role": "user", "content": placeholder}],
+                tokenize=False,
+                add_generation_prompt=True,
+            )
+            self._prompt_prefix, self._prompt_suffix = template.split(placeholder)
+
+            # Representative details: only their first characters meet the
+            # cached instructions, and that boundary is what must not merge
+            self._check_prompt_split(NONSENSE_INSTRUCTIONS, 'Address: "Calle Mayor 1"')
+            self._check_prompt_split(
+                CITY_INSTRUCTIONS, 'Province postal code prefix: 28\nCity: "Madrid"'
+            )
+
+            self._nonsense_cache = self._prefill(NONSENSE_INSTRUCTIONS)
+            self._city_cache = self._prefill(CITY_INSTRUCTIONS)
+
+    def _check_prompt_passthrough(self) -> None:
+        """Check that Outlines hands text prompts to mlx-lm unchanged.
+
+        Prompts are chat-formatted here: the template prefix and instructions
+        sit in the KV cache and only details + template suffix are passed to
+        the generator. An Outlines model that applies the chat template to str
+        prompts itself (MLXLM does from outlines 1.2.10) would wrap that text
+        in a second user turn after the cached instructions.
+
+        Raises:
+            ValueError: If the Outlines model rewrites text prompts
+        """
+        probe = "__PROMPT__"
+        if self._outlines_model.type_adapter.format_input(probe) != probe:
+            raise ValueError(
+                "Outlines applies the chat template to text prompts; the cached "
+                "prompt prefix needs prompts passed through unchanged "
+                "(use outlines<1.2.10)"
+            )
+
+    def _check_prompt_split(self, instructions: str, details: str) -> None:
+        """Check that the cached prefix plus the per-call text tokenize like the whole prompt.
+
+        The prefix (template start + instructions) is tokenized once for the
+        cache, and the details + template suffix are tokenized separately on
+        every call. That is only equivalent to tokenizing the full prompt if no
+        token spans the split and the second piece gets no special tokens
+        (such as a BOS) of its own. Whether Outlines passes the text on
+        unchanged is checked separately by _check_prompt_passthrough.
+
+        Raises:
+            ValueError: If the two-piece tokenization differs from the full prompt
+        """
+        prefix = self._prompt_prefix + instructions
+        rest = details + self._prompt_suffix
+        prefix_tokens = self._tokenizer.encode(prefix)
+        rest_tokens = self._tokenizer.encode(rest, add_special_tokens=False)
+
+        if prefix_tokens + rest_tokens != self._tokenizer.encode(prefix + rest):
+            raise ValueError(
+                f"Tokenizer of {self.model_path} merges tokens across the cached "
+                "prompt prefix; prompt caching would change the prompt"
+            )
+        # mlx-lm adds special tokens to a string prompt unless it starts with BOS
+        if self._tokenizer.encode(rest) != rest_tokens:
+            raise ValueError(
+                f"Tokenizer of {self.model_path} adds special tokens to the "
+                "per-call prompt; prompt caching would change the prompt"
+            )
+
+    def _prefill(self, instructions: str) -> tuple[list, int]:
+        """Build a KV cache holding the chat template prefix and instructions.
+
+        Returns the cache and the number of prefix tokens it holds.
+        """
+        tokens = self._tokenizer.encode(self._prompt_prefix + instructions)
+        cache = make_prompt_cache(self._model)
+        self._model(mx.array(tokens)[None], cache=cache)
+        mx.eval([c.state for c in cache])
+        return cache, len(tokens)
+
+    def _generate(
+        self,
+        generator,
+        prefix_cache: tuple[list, int],
+        details: str,
+        max_tokens: int,
+    ) -> str:
+        """Generate a response on top of a prefilled instructions cache.
+
+        Only the per-call details and the chat template suffix are prefilled.
+        The cache is trimmed back to the shared prefix afterwards so the next
+        call can reuse it.
+        """
+        cache, prefix_len = prefix_cache
+        try:
+            return generator(
+                details + self._prompt_suffix,
+                max_tokens=max_tokens,
+                prompt_cache=cache,
+            )
+        finally:
+            trim_prompt_cache(cache, cache[0].offset - prefix_len)
+
     def check_nonsense(self, address: str) -> NonsenseResult:
         """Check if an address appears to be intentional nonsense.
 
@@ -109,29 +255,74 @@ class AddressReviewer:
         """
         self._ensure_loaded()
 
-        prompt = f"""Analyze this Spanish address input and classify the user's intent.
+        output = self._generate(
+            self._nonsense_generator,
+            self._nonsense_cache,
+            f'Address: "{address}"',
+            NONSENSE_MAX_TOKENS,
+        )
+        parts = output.split("|", 2)
+        if len(parts) < 3:
+            # Cut off by the token budget before the reason: inconclusive, so
+            # the address is not rejected on it
+            return NonsenseResult(
+                intent=AddressIntent.VALID_ATTEMPT,
+                confidence="low",
+                explanation="LLM answer was truncated",
+            )
+        classification, confidence, reason = parts
 
-Address: "{address}"
+        return NonsenseResult(
+            intent=AddressIntent(classification),
+            confidence=confidence,
+            explanation=reason.strip()
+        )
 
-Classifications:
-- valid_attempt: A genuine attempt to provide an address (typos/incomplete OK)
-- gibberish: Random characters, keyboard mashing, meaningless text
-- refusal: User refused to provide address (e.g., "No quiero", "No tengo")
-- test_data: Obvious test/placeholder data (e.g., "TEST", "PRUEBA")
+    def check_nonsense_batch(self, addresses: list[str]) -> list[NonsenseResult]:
+        """Check a batch of addresses for intentional nonsense, one at a time.
 
-Return JSON with classification, confidence (high/medium/low), and reason."""
+        This only deduplicates: it is not batched decoding. Outlines' MLXLM
+        backend cannot run generate_batch with an output_type, so each
+        distinct address is still generated sequentially with check_nonsense
+        and the result is shared by its duplicates in the batch.
 
-        json_str = self._nonsense_generator(prompt)
-        result = NonsenseCheckOutput.model_validate_json(json_str)
+        Args:
+            addresses: Raw address strings
 
-        return NonsenseResult(
-            intent=AddressIntent(result.classification),
-            confidence=result.confidence,
-            explanation=result.reason
-        )
+        Returns:
+            NonsenseResult per address, in input order
+        """
+        results: dict[str, NonsenseResult] = {}
+        for address in addresses:
+            if address not in results:
+                results[address] = self.check_nonsense(address)
+        return [results[address] for address in addresses]
+
+    def validate_city_batch(
+        self, requests: list[tuple[str, str, Sequence[str]]]
+    ) -> list[CityValidationResult]:
+        """Validate a batch of (city, postcode, province_cities) requests, one at a time.
+
+        Like check_nonsense_batch this only deduplicates: each distinct
+        (city, province) pair is generated sequentially with validate_city.
+
+        Args:
+            requests: Tuples of city, postal code and known province cities
+
+        Returns:
+            CityValidationResult per request, in input order
+        """
+        results: dict[tuple[str, str], CityValidationResult] = {}
+        keys = []
+        for city, postcode, province_cities in requests:
+            key = (city, postcode[:2])
+            if key not in results:
+                results[key] = self.validate_city(city, postcode, province_cities)
+            keys.append(key)
+        return [results[key] for key in keys]
 
     def validate_city(
-        self, city: str, postcode: str, province_cities: list[str]
+        self, city: str, postcode: str, province_cities: Sequence[str]
     ) -> CityValidationResult:
         """Validate if a city name is a valid variant for a province.
 
@@ -147,16 +338,24 @@ Return JSON with classification, confidence (high/medium/low), and reason."""
 
         cities_str = ", ".join(province_cities[:10])
 
-        prompt = f"""Is "{city}" a valid name for a city in Spanish province with postal code starting with {postcode[:2]}?
-
-Reference cities in this province: {cities_str}
-
-Answer is_valid=true if the city name matches or is a variant of any reference city.
-Accept: exact matches, regional language variants, minor typos, missing accents.
-Answer is_valid=false only for fictional places or cities in a different Spanish province."""
+        details = (
+            f"Province postal code prefix: {postcode[:2]}\n"
+            f"Reference cities in this province: {cities_str}\n"
+            f'City: "{city}"'
+        )
 
-        json_str = self._city_generator(prompt)
-        result = CityValidationOutput.model_validate_json(json_str)
+        json_str = self._generate(
+            self._city_generator, self._city_cache, details, CITY_MAX_TOKENS
+        )
+        try:
+            result = CityValidationOutput.model_validate_json(json_str)
+        except ValidationError:
+            # JSON cut off by the token budget: leave the city unconfirmed
+            return CityValidationResult(
+                is_valid=False,
+                normalized_city=None,
+                explanation="LLM answer was truncated",
+            )
 
         # Only return normalized city if marked as valid
         normalized = None
@@ -2,17 +2,48 @@
 Text normalization utilities for Spanish addresses.
 """
 
+import functools
+import re
+import string
+import sys
 import unicodedata
 
+_WS_RE = re.compile(r"\s+")
+
+# Common articles/prepositions that are not useful as partial city matches
+_STOPWORDS: frozenset[str] = frozenset(
+    {"de", "del", "la", "el", "los", "las", "l", "d", "en", "a"}
+)
+
+# Accented letters used in Spanish, Catalan, Basque and Galician addresses
+_ACCENT_TABLE = str.maketrans(
+    "áàâäãéèêëíìîïóòôöõúùûüñçÁÀÂÄÃÉÈÊËÍÌÎÏÓÒÔÖÕÚÙÛÜÑÇ",
+    "aaaaaeeeeiiiiooooouuuuncAAAAAEEEEIIIIOOOOOUUUUNC",
+)
+
+# Lowercase and accent-fold in one translate pass: ASCII capitals plus the
+# letters above, all mapped straight to their lowercase base letter
+_FOLD_TABLE = {
+    **{ord(c): c.lower() for c in string.ascii_uppercase},
+    **{src: chr(dst).lower() for src, dst in _ACCENT_TABLE.items()},
+}
+
 
 def remove_accents(text: str) -> str:
     """Remove accents from text, keeping base characters.
 
     Example: "Málaga" → "Malaga", "Alarcón" → "Alarcon"
     """
-    # Normalize to decomposed form (separate base char from accent)
+    if text.isascii():
+        return text
+
+    # Translate the accented letters that appear in Spanish text
+    text = text.translate(_ACCENT_TABLE)
+    if text.isascii():
+        return text
+
+    # Rare characters outside the table: decompose and drop combining marks
     normalized = unicodedata.normalize("NFD", text)
-    # Keep only non-combining characters (remove accents)
     return "".join(c for c in normalized if unicodedata.category(c) != "Mn")
 
 
@@ -24,39 +55,54 @@ def normalize_for_comparison(text: str) -> str:
     - Strip whitespace
     - Collapse multiple spaces
     """
-    text = text.lower()
-    text = remove_accents(text)
-    text = " ".join(text.split())  # Collapse whitespace
-    return text.strip()
+    stripped = text.strip()
+    # Fast path: single ASCII token (no space; other ASCII whitespace is
+    # non-printable), so there is nothing to de-accent or collapse
+    if stripped.isascii() and stripped.isprintable() and " " not in stripped:
+        return stripped.lower()
+
+    text = text.translate(_FOLD_TABLE)
+    if not text.isascii():
+        # Letters outside the table still need the full Unicode treatment
+        text = remove_accents(text.lower())
+    return _WS_RE.sub(" ", text).strip()  # Collapse whitespace
 
 
+@functools.lru_cache(maxsize=65536)
 def normalize_city(city: str) -> str:
     """Normalize city name for lookup.
 
+    Cached because the same city strings repeat thousands of times in a CSV.
+    The result is interned, so it is the same object as the matching key in
+    the validator's dicts and lookups compare by identity.
+
     Handles common variations like:
     - "Pozuelo de Alarcón" → "pozuelo de alarcon"
     - "L'Hospitalet" → "l'hospitalet" (keep apostrophe)
     - "Vitoria-Gasteiz" → "vitoria-gasteiz" (keep hyphen)
     """
-    return normalize_for_comparison(city)
+    return sys.intern(normalize_for_comparison(city))
 
 
-def extract_city_variants(city: str) -> list[str]:
+@functools.lru_cache(maxsize=65536)
+def extract_city_variants(city: str) -> tuple[str, ...]:
     """Generate variants of a city name for matching.
 
+    Cached because the same city strings repeat across reference entries and
+    CSV rows. Returns a tuple (full name first) so the cached value is immutable.
+
     Example: "Pozuelo de Alarcón" →
-        ["pozuelo de alarcon", "pozuelo", "alarcon"]
+        ("pozuelo de alarcon", "pozuelo", "alarcon")
     """
     normalized = normalize_city(city)
-    variants = [normalized]
 
     # Add individual words (for partial matching like "Pozuelo")
     words = normalized.replace("-", " ").replace("'", " ").split()
 
     # Filter out common articles/prepositions
-    stopwords = {"de", "del", "la", "el", "los", "las", "l", "d", "en", "a"}
-    meaningful_words = [w for w in words if w not in stopwords and len(w) > 2]
-
-    variants.extend(meaningful_words)
+    meaningful_words = [
+        sys.intern(w) for w in words if w not in _STOPWORDS and len(w) > 2
+    ]
 
-    return list(set(variants))
+    # Deduplicate while keeping order
+    return tuple(dict.fromkeys((normalized, *meaningful_words)))
@@ -4,13 +4,19 @@ Address parsing using libpostal.
 Extracts structured components from unstructured Spanish address strings.
 """
 
+import functools
+from collections.abc import Iterable
 from dataclasses import dataclass
+
 from postal.parser import parse_address
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ParsedAddress:
-    """Structured address components extracted from raw text."""
+    """Structured address components extracted from raw text.
+
+    Frozen so that cached parse results can be shared between callers.
+    """
 
     raw: str  # Original input
     road: str | None = None  # Street name
@@ -46,51 +52,75 @@ class ParsedAddress:
         return " ".join(parts)
 
 
-def parse(raw_address: str) -> ParsedAddress:
-    """Parse a raw address string into structured components.
+# libpostal label → position in the _map_components result
+_LABEL_TO_INDEX = {
+    "road": 0,
+    "house_number": 1,
+    "city": 3,
+    "postcode": 4,
+    "state_district": 5,
+    "country": 6,
+}
 
-    Uses libpostal for parsing, which handles international address formats.
+# Labels combined into the unit field (position 2)
+_UNIT_LABELS = frozenset({"level", "unit", "staircase"})
+_UNIT_INDEX = 2
 
-    Args:
-        raw_address: Unstructured address string
 
-    Returns:
-        ParsedAddress with extracted components
-    """
-    if not raw_address or not raw_address.strip():
-        return ParsedAddress(raw="")
+def _map_components(
+    components: Iterable[tuple[str, str]],
+) -> tuple[str | None, str | None, str | None, str | None, str | None, str | None, str | None]:
+    """Map libpostal (value, label) pairs to our fields.
 
-    raw_address = raw_address.strip()
-    result = ParsedAddress(raw=raw_address)
-
-    # Parse with libpostal
-    components = parse_address(raw_address)
+    Returns (road, house_number, unit, city, postcode, state_district, country).
+    """
+    values: list[str | None] = [None] * 7
 
-    # Map libpostal labels to our fields
     # libpostal can return multiple values for same label, we take the first
     unit_parts = []
 
     for value, label in components:
-        if label == "road" and result.road is None:
-            result.road = value
-        elif label == "house_number" and result.house_number is None:
-            result.house_number = value
-        elif label in ("level", "unit", "staircase"):
+        if label in _UNIT_LABELS:
             unit_parts.append(value)
-        elif label == "city" and result.city is None:
-            result.city = value
-        elif label == "postcode" and result.postcode is None:
-            result.postcode = value
-        elif label == "state_district" and result.state_district is None:
-            result.state_district = value
-        elif label == "country" and result.country is None:
-            result.country = value
+            continue
+        index = _LABEL_TO_INDEX.get(label)
+        if index is not None and values[index] is None:
+            values[index] = value
 
     # Combine unit parts
     if unit_parts:
-        result.unit = ", ".join(unit_parts)
+        values[_UNIT_INDEX] = ", ".join(unit_parts)
 
-    return result
+    return tuple(values)
+
+
+@functools.lru_cache(maxsize=131072)
+def _parse_cached(raw: str) -> ParsedAddress:
+    """Parse an already-stripped, non-empty address, memoizing the result.
+
+    Address CSVs repeat the same strings a lot (same street across customers),
+    so caching avoids calling into libpostal and mapping its components again.
+    ParsedAddress is frozen, so the cached object is safe to hand out.
+    """
+    return ParsedAddress(raw, *_map_components(parse_address(raw)))
+
+
+def parse(raw_address: str) -> ParsedAddress:
+    """Parse a raw address string into structured components.
+
+    Uses libpostal for parsing, which handles international address formats.
+
+    Args:
+        raw_address: Unstructured address string
+
+    Returns:
+        ParsedAddress with extracted components
+    """
+    if not raw_address or not raw_address.strip():
+        return ParsedAddress(raw="")
+
+    # Parse with libpostal (cached for repeated addresses)
+    return _parse_cached(raw_address.strip())
 
 
 def parse_or_use_existing(
@@ -114,10 +144,20 @@ def parse_or_use_existing(
     parsed = parse(raw_address)
 
     # If structured data was provided, prefer it over parsed values
-    if city and city.strip():
-        parsed.city = city.strip()
-
-    if postcode and postcode.strip():
-        parsed.postcode = postcode.strip()
-
-    return parsed
+    city = city.strip() if city else ""
+    postcode = postcode.strip() if postcode else ""
+    if not city and not postcode:
+        return parsed
+
+    # Parse results are cached and shared, so build a copy instead of
+    # mutating (direct construction is cheaper than dataclasses.replace)
+    return ParsedAddress(
+        raw=parsed.raw,
+        road=parsed.road,
+        house_number=parsed.house_number,
+        unit=parsed.unit,
+        city=city or parsed.city,
+        postcode=postcode or parsed.postcode,
+        state_district=parsed.state_district,
+        country=parsed.country,
+    )
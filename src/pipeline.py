@@ -9,14 +9,33 @@ Orchestrates:
 """
 
 import csv
+import itertools
+import logging
+from collections import Counter, deque
+from collections.abc import Callable, Generator, Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
+from typing import Any
 
 from src.parsing.address import parse, parse_or_use_existing, ParsedAddress
-from src.validation.rules import validate_hard_rules, get_violations, RuleViolation
+from src.validation.rules import (
+    RuleViolation,
+    fast_rule_bits,
+    looks_like_street_address,
+    violations_from_bits,
+)
 from src.validation.postal_codes import PostalCodeValidator, ValidationStatus
-from src.llm.reviewer import AddressReviewer, AddressIntent
+from src.llm.reviewer import (
+    AddressReviewer,
+    AddressIntent,
+    CityValidationResult,
+    DEFAULT_MODEL_PATH,
+    NonsenseResult,
+)
+
+logger = logging.getLogger(__name__)
 
 
 class AddressStatus(str, Enum):
@@ -31,7 +50,20 @@ class AddressStatus(str, Enum):
     NEEDS_REVIEW = "needs_review"  # LLM uncertain, needs human review
 
 
-@dataclass
+# Status and message for an address rejected by a hard rule
+_VIOLATION_TO_STATUS_MSG: dict[RuleViolation, tuple[AddressStatus, str]] = {
+    RuleViolation.EMPTY_ADDRESS: (AddressStatus.INVALID_FORMAT, "Address is empty"),
+    RuleViolation.TOO_SHORT: (AddressStatus.INVALID_FORMAT, "Address too short"),
+    RuleViolation.ONLY_NUMBERS: (AddressStatus.INVALID_FORMAT, "Address contains only numbers"),
+    RuleViolation.INVALID_POSTCODE_FORMAT: (AddressStatus.INVALID_FORMAT, "Invalid postal code format"),
+    RuleViolation.INVALID_POSTCODE_PROVINCE: (
+        AddressStatus.INVALID_FORMAT,
+        "Invalid postal code province (must be 01-52)",
+    ),
+}
+
+
+@dataclass(slots=True)
 class ValidationResult:
     """Complete validation result for an address."""
 
@@ -58,6 +90,135 @@ class ValidationResult:
     llm_confidence: str | None = None
 
 
+@dataclass(slots=True)
+class NonsenseTask:
+    """Pending LLM nonsense check for a street address."""
+
+    text: str
+
+
+@dataclass(slots=True)
+class CityTask:
+    """Pending LLM validation of a city unknown to the reference data."""
+
+    city: str
+    postcode: str
+    province_cities: tuple[str, ...]
+
+
+LLMTask = NonsenseTask | CityTask
+
+# Validation stages yield LLMTasks and receive the reviewer's answer
+Stages = Generator[LLMTask, NonsenseResult | CityValidationResult, None]
+
+
+@dataclass(slots=True)
+class _WindowEntry:
+    """A CSV row held back while its LLM tasks are batched."""
+
+    row: list[str]
+    result: ValidationResult
+    stages: Stages
+    task: LLMTask | None
+
+
+class _BufferedRowWriter:
+    """csv.writer wrapper that writes rows in batches with writerows.
+
+    Use it as a context manager: buffered rows are flushed on exit, also
+    when processing stops with an exception.
+    """
+
+    def __init__(self, outfile: Any, batch_rows: int = 4096):
+        self._writer = csv.writer(outfile)
+        self._rows: list[list[str]] = []
+        self._batch_rows = batch_rows
+
+    def writerow(self, row: list[str]) -> None:
+        self._rows.append(row)
+        if len(self._rows) >= self._batch_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        self._writer.writerows(self._rows)
+        self._rows.clear()
+
+    def __enter__(self) -> "_BufferedRowWriter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.flush()
+
+
+def _parse_chunk(rows: list[tuple[str, str, str]]) -> list[ParsedAddress]:
+    """Parse a chunk of (address, city, postcode) rows in a worker process."""
+    return [parse_or_use_existing(address, city, postcode) for address, city, postcode in rows]
+
+
+# Deterministic pipeline owned by each validation worker process
+_worker_pipeline: "AddressPipeline | None" = None
+
+
+def _init_validation_worker(reference_dir: Path) -> None:
+    """Load the reference data once per validation worker."""
+    global _worker_pipeline
+    _worker_pipeline = AddressPipeline(reference_dir, use_llm=False)
+
+
+def _validate_chunk(rows: list[tuple[str, str, str]]) -> list["ValidationResult"]:
+    """Fully validate a chunk of (address, city, postcode) rows without the LLM."""
+    validate = _worker_pipeline.validate
+    return [validate(address, city, postcode) for address, city, postcode in rows]
+
+
+def _iter_chunked(
+    func: Callable[[list[tuple[str, str, str]]], list],
+    rows: Iterable[tuple[list[str], str, str, str]],
+    workers: int,
+    chunk_size: int,
+    initializer: Callable[..., None] | None = None,
+    initargs: tuple = (),
+) -> Iterator[tuple[tuple[list[str], str, str, str], Any]]:
+    """Map func over chunks of rows in a process pool, yielding in input order.
+
+    func receives the (address, city, postcode) fields of each row. At most
+    two chunks per worker are in flight, so memory stays bounded on large
+    inputs.
+    """
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=initializer, initargs=initargs
+    ) as executor:
+        pending = deque()
+        for chunk in itertools.batched(rows, chunk_size):
+            fields = [item[1:] for item in chunk]
+            pending.append((chunk, executor.submit(func, fields)))
+            if len(pending) >= 2 * workers:
+                chunk, future = pending.popleft()
+                yield from zip(chunk, future.result())
+
+        while pending:
+            chunk, future = pending.popleft()
+            yield from zip(chunk, future.result())
+
+
+def _iter_parsed(
+    rows: Iterable[tuple[list[str], str, str, str]],
+    workers: int,
+    chunk_size: int,
+) -> Iterator[tuple[tuple[list[str], str, str, str], ParsedAddress]]:
+    """Parse (row, address, city, postcode) tuples, yielding results in input order.
+
+    With more than one worker, chunks of rows are parsed in a process pool
+    (each worker loads libpostal once).
+    """
+    if workers <= 1:
+        for item in rows:
+            yield item, parse_or_use_existing(*item[1:])
+        return
+
+    yield from _iter_chunked(_parse_chunk, rows, workers, chunk_size)
+
+
 class AddressPipeline:
     """Main pipeline for validating and cleaning addresses."""
 
@@ -65,7 +226,7 @@ class AddressPipeline:
         self,
         reference_dir: Path,
         use_llm: bool = True,
-        model_path: str = "mlx-community/Qwen2.5-7B-Instruct-4bit",
+        model_path: str = DEFAULT_MODEL_PATH,
     ):
         """Initialize the pipeline.
 
@@ -104,8 +265,48 @@ class AddressPipeline:
         """
         # Stage 1: Parse address
         parsed = parse_or_use_existing(address, city, postcode)
+        return self.validate_parsed(parsed, address, city, postcode)
+
+    def validate_parsed(
+        self,
+        parsed: ParsedAddress,
+        address: str,
+        city: str = "",
+        postcode: str = "",
+    ) -> ValidationResult:
+        """Run validation stages 2+ on an already parsed address.
+
+        Args:
+            parsed: Result of parse_or_use_existing for the raw fields
+            address: Raw street address
+            city: Raw city value
+            postcode: Raw postal code value
 
-        result = ValidationResult(
+        Returns:
+            ValidationResult with status and details
+        """
+        result = self._new_result(parsed, address, city, postcode)
+        stages = self._run_stages(result)
+
+        # Answer each LLM request as soon as the stages make it
+        try:
+            task = next(stages)
+            while True:
+                task = stages.send(self._review(task))
+        except StopIteration:
+            pass
+
+        return result
+
+    def _new_result(
+        self,
+        parsed: ParsedAddress,
+        address: str,
+        city: str,
+        postcode: str,
+    ) -> ValidationResult:
+        """Create the initial (unknown) result for a parsed address."""
+        return ValidationResult(
             raw_address=address,
             raw_city=city,
             raw_postcode=postcode,
@@ -114,107 +315,142 @@ class AddressPipeline:
             message="",
         )
 
+    def _review(self, task: LLMTask) -> NonsenseResult | CityValidationResult:
+        """Run a single LLM task."""
+        if isinstance(task, NonsenseTask):
+            return self.llm_reviewer.check_nonsense(task.text)
+        return self.llm_reviewer.validate_city(
+            task.city, task.postcode, task.province_cities
+        )
+
+    def _review_batch(
+        self, tasks: list[LLMTask]
+    ) -> list[NonsenseResult | CityValidationResult]:
+        """Run a batch of LLM tasks, grouped by kind, returning answers in order.
+
+        The reviewer's batch methods generate sequentially; batching only
+        lets them skip repeated tasks within the batch.
+        """
+        nonsense_idx = [i for i, t in enumerate(tasks) if isinstance(t, NonsenseTask)]
+        city_idx = [i for i, t in enumerate(tasks) if isinstance(t, CityTask)]
+
+        answers: list = [None] * len(tasks)
+        if nonsense_idx:
+            nonsense_results = self.llm_reviewer.check_nonsense_batch(
+                [tasks[i].text for i in nonsense_idx]
+            )
+            for i, answer in zip(nonsense_idx, nonsense_results):
+                answers[i] = answer
+        if city_idx:
+            city_results = self.llm_reviewer.validate_city_batch(
+                [(tasks[i].city, tasks[i].postcode, tasks[i].province_cities) for i in city_idx]
+            )
+            for i, answer in zip(city_idx, city_results):
+                answers[i] = answer
+        return answers
+
+    def _run_stages(self, result: ValidationResult) -> Stages:
+        """Run validation stages 2+ on a result, filling it in place.
+
+        Deterministic stages run inline. Whenever the LLM is needed, the
+        generator yields an LLMTask and expects the reviewer's answer to be
+        sent back, which lets callers answer one task at a time or batch
+        tasks across many rows.
+        """
+        parsed = result.parsed
+        address = result.raw_address
+
         # Stage 2: Hard validation rules
-        violations = get_violations(parsed)
-        result.rule_violations = [v.message for v in violations]
-
-        if violations:
-            # Check what type of violation
-            violation_types = {v.violation for v in violations}
-
-            if RuleViolation.EMPTY_ADDRESS in violation_types:
-                result.status = AddressStatus.INVALID_FORMAT
-                result.message = "Address is empty"
-                return result
-
-            if RuleViolation.TOO_SHORT in violation_types:
-                result.status = AddressStatus.INVALID_FORMAT
-                result.message = "Address too short"
-                return result
-
-            if RuleViolation.ONLY_NUMBERS in violation_types:
-                result.status = AddressStatus.INVALID_FORMAT
-                result.message = "Address contains only numbers"
-                return result
-
-            if RuleViolation.INVALID_POSTCODE_FORMAT in violation_types:
-                result.status = AddressStatus.INVALID_FORMAT
-                result.message = "Invalid postal code format"
-                return result
-
-            if RuleViolation.INVALID_POSTCODE_PROVINCE in violation_types:
-                result.status = AddressStatus.INVALID_FORMAT
-                result.message = "Invalid postal code province (must be 01-52)"
-                return result
-
-        # Stage 3: LLM nonsense detection on the street address (if enabled)
-        # Do this before city validation to catch gibberish addresses
-        # Check the road if available, otherwise check the raw address
-        # (libpostal sometimes parses gibberish as "house" instead of "road")
-        text_to_check = parsed.road if parsed.has_road else address
-        if self.use_llm and text_to_check:
-            nonsense_result = self.llm_reviewer.check_nonsense(text_to_check)
-            result.llm_intent = nonsense_result.intent.value
-            result.llm_confidence = nonsense_result.confidence
-
-            if nonsense_result.intent in (
-                AddressIntent.GIBBERISH,
-                AddressIntent.TEST_DATA,
-            ):
-                result.status = AddressStatus.NONSENSE
-                result.message = f"Street address is {nonsense_result.intent.value}: {nonsense_result.explanation}"
-                return result
-            elif nonsense_result.intent == AddressIntent.REFUSAL:
-                result.status = AddressStatus.NONSENSE
-                result.message = f"User refused to provide address: {nonsense_result.explanation}"
-                return result
-
-        # Stage 4: City-postal code validation (if both present)
+        violation_bits = fast_rule_bits(parsed)
+
+        if violation_bits:
+            # Only build violation messages when some rule failed; the first
+            # one (highest priority) sets the status
+            violations = violations_from_bits(parsed, violation_bits)
+            result.rule_violations = [v.message for v in violations]
+            result.status, result.message = _VIOLATION_TO_STATUS_MSG[violations[0].violation]
+            return
+
+        # Stage 3: City-postal code validation (if both present)
+        # Runs before the LLM so a mismatch is rejected without any LLM call
+        city_result = None
         if parsed.has_city and parsed.has_postcode:
             city_result = self.postal_validator.validate(parsed.city, parsed.postcode)
             result.city_postal_status = city_result.status.value
 
-            if city_result.status == ValidationStatus.VALID:
-                result.status = AddressStatus.VALID
-                result.message = "City matches postal code province"
-                result.normalized_city = parsed.city
-                result.normalized_postcode = parsed.postcode
-                return result
-
-            elif city_result.status == ValidationStatus.INVALID:
+            if city_result.status == ValidationStatus.INVALID:
                 result.status = AddressStatus.INVALID_MISMATCH
                 result.message = city_result.message
-                return result
+                return
 
-            elif city_result.status == ValidationStatus.UNKNOWN_CITY:
-                # City not in database - try LLM if enabled
-                if self.use_llm:
-                    province_cities = self.postal_validator.get_cities_for_province(
-                        parsed.postcode[:2]
-                    )
-                    llm_result = self.llm_reviewer.validate_city(
-                        parsed.city, parsed.postcode, province_cities
-                    )
-                    result.llm_confidence = "city_validation"
-
-                    if llm_result.is_valid:
-                        result.status = AddressStatus.VALID_NORMALIZED
-                        result.message = f"City validated by LLM: {llm_result.explanation}"
-                        result.normalized_city = llm_result.normalized_city or parsed.city
-                        result.normalized_postcode = parsed.postcode
-                        return result
-                    else:
-                        result.status = AddressStatus.NEEDS_REVIEW
-                        result.message = f"City unknown: {llm_result.explanation}"
-                        return result
+        city_confirmed = (
+            city_result is not None and city_result.status == ValidationStatus.VALID
+        )
+
+        # Stage 4: LLM nonsense detection on the street address (if enabled)
+        # Check the road if available, otherwise check the raw address
+        # (libpostal sometimes parses gibberish as "house" instead of "road")
+        # Obvious street addresses (keyword + number) skip the LLM entirely.
+        # A confirmed city/postcode says nothing about the street itself.
+        text_to_check = parsed.road if parsed.has_road else address
+        if self.use_llm and text_to_check:
+            if looks_like_street_address(address):
+                # The pre-filter answers for the LLM, with high confidence
+                result.llm_intent = AddressIntent.VALID_ATTEMPT.value
+                result.llm_confidence = "high"
+            else:
+                nonsense_result = yield NonsenseTask(text_to_check)
+                result.llm_intent = nonsense_result.intent.value
+                result.llm_confidence = nonsense_result.confidence
+
+                if nonsense_result.intent in (
+                    AddressIntent.GIBBERISH,
+                    AddressIntent.TEST_DATA,
+                ):
+                    result.status = AddressStatus.NONSENSE
+                    result.message = f"Street address is {nonsense_result.intent.value}: {nonsense_result.explanation}"
+                    return
+                elif nonsense_result.intent == AddressIntent.REFUSAL:
+                    result.status = AddressStatus.NONSENSE
+                    result.message = f"User refused to provide address: {nonsense_result.explanation}"
+                    return
+
+        if city_confirmed:
+            result.status = AddressStatus.VALID
+            result.message = "City matches postal code province"
+            result.normalized_city = parsed.city
+            result.normalized_postcode = parsed.postcode
+            return
+
+        # City not in database - try LLM if enabled
+        if city_result is not None and city_result.status == ValidationStatus.UNKNOWN_CITY:
+            if self.use_llm:
+                province_cities = self.postal_validator.get_cities_for_province(
+                    parsed.postcode[:2]
+                )
+                llm_result = yield CityTask(
+                    parsed.city, parsed.postcode, province_cities
+                )
+                result.llm_confidence = "city_validation"
+
+                if llm_result.is_valid:
+                    result.status = AddressStatus.VALID_NORMALIZED
+                    result.message = f"City validated by LLM: {llm_result.explanation}"
+                    result.normalized_city = llm_result.normalized_city or parsed.city
+                    result.normalized_postcode = parsed.postcode
+                    return
                 else:
                     result.status = AddressStatus.NEEDS_REVIEW
-                    result.message = "City not found in database"
-                    return result
+                    result.message = f"City unknown: {llm_result.explanation}"
+                    return
+            else:
+                result.status = AddressStatus.NEEDS_REVIEW
+                result.message = "City not found in database"
+                return
 
         # Stage 5: Final fallback for addresses without city/postcode
         if self.use_llm and result.status == AddressStatus.UNKNOWN:
-            # Already checked nonsense in stage 3, so if we're here it's a valid attempt
+            # Already checked nonsense in stage 4, so if we're here it's a valid attempt
             if parsed.has_city or parsed.has_postcode:
                 result.status = AddressStatus.VALID
                 result.message = "Appears to be a valid address attempt"
@@ -227,8 +463,6 @@ class AddressPipeline:
             result.status = AddressStatus.NEEDS_REVIEW
             result.message = "Could not validate without LLM"
 
-        return result
-
     def process_csv(
         self,
         input_path: Path,
@@ -237,6 +471,10 @@ class AddressPipeline:
         city_col: str | None = "city",
         postcode_col: str | None = "zip",
         limit: int | None = None,
+        workers: int = 1,
+        chunk_size: int = 1000,
+        batch_size: int = 32,
+        progress_every: int = 10_000,
     ) -> dict:
         """Process a CSV file of addresses.
 
@@ -247,11 +485,21 @@ class AddressPipeline:
             city_col: Column name for city (optional)
             postcode_col: Column name for postal code (optional)
             limit: Maximum rows to process (for testing)
+            workers: Worker processes. Without the LLM each worker runs the
+                whole deterministic pipeline; with it, workers only parse
+                addresses and LLM review runs in this process
+            chunk_size: Rows sent to a parsing worker at a time
+            batch_size: Pending LLM tasks accumulated before they are sent
+                to the reviewer together (duplicate tasks in a batch are
+                generated once; there is no batched decoding). Rows are also
+                resolved once 4 * batch_size of them are held back
+            progress_every: Log a progress message (at INFO, on this module's
+                logger) every this many rows; 0 disables it
 
         Returns:
             Summary statistics
         """
-        stats = {
+        stats = Counter({
             "total": 0,
             "valid": 0,
             "valid_normalized": 0,
@@ -260,11 +508,19 @@ class AddressPipeline:
             "nonsense": 0,
             "needs_review": 0,
             "unknown": 0,
-        }
+        })
+
+        with open(input_path, "r", encoding="utf-8", newline="", buffering=1 << 20) as infile:
+            reader = csv.reader(infile)
+            fieldnames = next(reader, [])
+            num_fields = len(fieldnames)
 
-        with open(input_path, "r", encoding="utf-8") as infile:
-            reader = csv.DictReader(infile)
-            fieldnames = reader.fieldnames or []
+            # Resolve columns to indices once; like DictReader, a repeated
+            # header name refers to its last occurrence
+            column_index = {name: i for i, name in enumerate(fieldnames)}
+            address_idx = column_index.get(address_col)
+            city_idx = column_index.get(city_col) if city_col else None
+            postcode_idx = column_index.get(postcode_col) if postcode_col else None
 
             # Add output columns
             output_fields = fieldnames + [
@@ -277,43 +533,132 @@ class AddressPipeline:
                 "parsed_postcode",
             ]
 
-            with open(output_path, "w", encoding="utf-8", newline="") as outfile:
-                writer = csv.DictWriter(outfile, fieldnames=output_fields)
-                writer.writeheader()
-
-                for i, row in enumerate(reader):
-                    if limit and i >= limit:
-                        break
-
-                    stats["total"] += 1
-
-                    # Extract fields
-                    address = row.get(address_col, "")
-                    city = row.get(city_col, "") if city_col else ""
-                    postcode = row.get(postcode_col, "") if postcode_col else ""
-
-                    # Validate
-                    result = self.validate(address, city, postcode)
-
-                    # Update stats
-                    status_key = result.status.value.replace("-", "_")
-                    if status_key in stats:
-                        stats[status_key] += 1
-
-                    # Write output row
-                    output_row = dict(row)
-                    output_row["validation_status"] = result.status.value
-                    output_row["validation_message"] = result.message
-                    output_row["normalized_city"] = result.normalized_city or ""
-                    output_row["normalized_postcode"] = result.normalized_postcode or ""
-                    output_row["parsed_road"] = result.parsed.road or ""
-                    output_row["parsed_city"] = result.parsed.city or ""
-                    output_row["parsed_postcode"] = result.parsed.postcode or ""
-
-                    writer.writerow(output_row)
-
-                    # Progress
-                    if stats["total"] % 100 == 0:
-                        print(f"Processed {stats['total']} addresses...")
-
-        return stats
+            with open(
+                output_path, "w", encoding="utf-8", newline="", buffering=1 << 20
+            ) as outfile, _BufferedRowWriter(outfile) as writer:
+                writer.writerow(output_fields)
+
+                # Skip blank lines (as DictReader does) and pad or trim each
+                # row to the header so output columns always line up
+                rows = (
+                    row if len(row) == num_fields
+                    else (row + [""] * (num_fields - len(row)))[:num_fields]
+                    for row in reader
+                    if row
+                )
+
+                # Stop reading the input once the limit is reached
+                if limit:
+                    rows = itertools.islice(rows, limit)
+
+                # Extract fields
+                row_fields = (
+                    (
+                        row,
+                        row[address_idx] if address_idx is not None else "",
+                        row[city_idx] if city_idx is not None else "",
+                        row[postcode_idx] if postcode_idx is not None else "",
+                    )
+                    for row in rows
+                )
+
+                # Bound once for the per-row loops below
+                write_result = self._write_result
+
+                if not self.use_llm and workers > 1:
+                    # Every stage is deterministic, so rows are validated
+                    # end to end in the workers
+                    for (row, *_), result in _iter_chunked(
+                        _validate_chunk,
+                        row_fields,
+                        workers,
+                        chunk_size,
+                        initializer=_init_validation_worker,
+                        initargs=(self.postal_validator.reference_dir,),
+                    ):
+                        write_result(writer, stats, row, result, progress_every)
+                    return dict(stats)
+
+                # Rows waiting on the LLM are held in a window (to keep output
+                # order) until batch_size tasks are pending, then answered together
+                window: list[_WindowEntry] = []
+                num_pending = 0
+                # Rows that need no LLM still wait behind pending ones; resolve
+                # early once the window is this long so memory stays bounded
+                max_window = 4 * batch_size
+                new_result = self._new_result
+                run_stages = self._run_stages
+
+                for (row, address, city, postcode), parsed in _iter_parsed(
+                    row_fields, workers, chunk_size
+                ):
+                    # Validate deterministic stages up to the first LLM task
+                    result = new_result(parsed, address, city, postcode)
+                    stages = run_stages(result)
+                    task = next(stages, None)
+                    window.append(_WindowEntry(row, result, stages, task))
+                    if task is not None:
+                        num_pending += 1
+
+                    if (
+                        num_pending == 0
+                        or num_pending >= batch_size
+                        or len(window) >= max_window
+                    ):
+                        self._resolve_window(window)
+                        for entry in window:
+                            write_result(writer, stats, entry.row, entry.result, progress_every)
+                        window.clear()
+                        num_pending = 0
+
+                self._resolve_window(window)
+                for entry in window:
+                    write_result(writer, stats, entry.row, entry.result, progress_every)
+
+        return dict(stats)
+
+    def _resolve_window(self, window: list[_WindowEntry]) -> None:
+        """Answer pending LLM tasks in batches until every row's stages finish."""
+        while True:
+            waiting = [entry for entry in window if entry.task is not None]
+            if not waiting:
+                return
+
+            answers = self._review_batch([entry.task for entry in waiting])
+            for entry, answer in zip(waiting, answers):
+                try:
+                    entry.task = entry.stages.send(answer)
+                except StopIteration:
+                    entry.task = None
+
+    def _write_result(
+        self,
+        writer: _BufferedRowWriter,
+        stats: Counter,
+        row: list[str],
+        result: ValidationResult,
+        progress_every: int,
+    ) -> None:
+        """Write one validated row and update the summary statistics."""
+        total = stats["total"] + 1
+        stats["total"] = total
+
+        # Update stats
+        status_value = result.status.value
+        stats[status_value] += 1
+
+        # Write output row
+        parsed = result.parsed
+        writer.writerow(row + [
+            status_value,
+            result.message,
+            result.normalized_city or "",
+            result.normalized_postcode or "",
+            parsed.road or "",
+            parsed.city or "",
+            parsed.postcode or "",
+        ])
+
+        # Progress
+        if progress_every and total % progress_every == 0:
+            logger.info("Processed %d addresses...", total)
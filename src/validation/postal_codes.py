@@ -4,6 +4,9 @@ Postal code validation for Spanish addresses.
 Validates that city names match their postal code province (first 2 digits).
 """
 
+import sys
+from array import array
+from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
@@ -18,12 +21,12 @@ class ValidationStatus(Enum):
     MISSING_DATA = "missing_data"  # City or postal code is empty/invalid
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     status: ValidationStatus
     message: str
     province_code: str | None = None
-    expected_cities: list[str] | None = None
+    expected_cities: tuple[str, ...] | None = None
 
 
 class PostalCodeValidator:
@@ -32,65 +35,123 @@ class PostalCodeValidator:
     def __init__(self, reference_dir: Path):
         """Load reference data from codciu.txt. It contains an index to the corresponding file of a city. A file of a city contains its postal code - streets pairs.
 
+        The file is read lazily, on the first lookup, so creating a validator
+        that is never used costs nothing.
+
         Args:
             reference_dir: Path to directory containing codciu.txt
         """
         self.reference_dir = reference_dir
 
-        # Province code (2 digits) → list of city names
-        self.province_to_cities: dict[str, list[str]] = {}
-
-        # Normalized city name → province code (2 digits)
-        self.city_to_province: dict[str, str] = {}
-
-        # City variant (partial name) → full city names
-        self.variant_to_cities: dict[str, list[str]] = {}
-
-        self._load_reference_data()
-
-    def _load_reference_data(self) -> None:
-        """Load and parse codciu.txt."""
-        codciu_path = self.reference_dir / "codciu.txt"
+        # Province code (2 digits) → city names (immutable, safe to hand out)
+        self.province_to_cities: dict[str, tuple[str, ...]] = {}
 
-        with open(codciu_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
+        # Province codes indexed by a small int id. codciu.txt also lists
+        # non-numeric codes (Andorra is "AD"), so ids are positions here
+        # rather than the numeric code; strings only come back out at the API.
+        self.province_codes: list[str] = []
+        self._province_ids: dict[str, int] = {}
 
-                # Format: 3-char code + city name
-                # e.g., "286Pozuelo de Alarcón" or "28xMadrid"
-                if len(line) < 4:
-                    continue
+        # Normalized city name → province id (the last entry wins when a
+        # name appears in several provinces)
+        self.city_to_province: dict[str, int] = {}
 
-                code = line[:3]
-                city = line[3:].strip()
+        # Every (normalized city name, province id) pair in the reference data
+        self._valid_pairs: frozenset[tuple[str, int]] = frozenset()
 
-                if not city:
-                    continue
+        # Canonical city names and their normalized forms, indexed by city id
+        self.city_names: list[str] = []
+        self.city_normalized: list[str] = []
 
-                # Extract province (first 2 digits)
-                province = code[:2]
+        # City id → province id, resolved once so variant matching never has
+        # to go back through city_to_province
+        self.city_province_ids: array = array("H")
 
-                # Handle entries with multiple names (e.g., "Alacant-Alicante")
-                city_names = self._split_city_names(city)
+        # City variant (partial name) → ids into city_names
+        self.variant_to_city_ids: dict[str, array] = {}
 
-                for city_name in city_names:
-                    # Add to province → cities mapping
-                    if province not in self.province_to_cities:
-                        self.province_to_cities[province] = []
-                    self.province_to_cities[province].append(city_name)
+        self._loaded = False
 
-                    # Add to city → province mapping (normalized)
-                    normalized = normalize_city(city_name)
-                    self.city_to_province[normalized] = province
+    def _ensure_loaded(self) -> None:
+        """Load the reference data on first use."""
+        if not self._loaded:
+            self._load_reference_data()
+            self._loaded = True
 
-                    # Add variants for partial matching
-                    for variant in extract_city_variants(city_name):
-                        if variant not in self.variant_to_cities:
-                            self.variant_to_cities[variant] = []
-                        if city_name not in self.variant_to_cities[variant]:
-                            self.variant_to_cities[variant].append(city_name)
+    def _load_reference_data(self) -> None:
+        """Load and parse codciu.txt."""
+        codciu_path = self.reference_dir / "codciu.txt"
+        lines = codciu_path.read_text(encoding="utf-8").splitlines()
+
+        province_to_cities: defaultdict[str, list[str]] = defaultdict(list)
+        variant_to_city_ids: defaultdict[str, array] = defaultdict(lambda: array("I"))
+        name_to_id: dict[str, int] = {}
+        valid_pairs: set[tuple[str, int]] = set()
+
+        # Bound once; the loop below runs for every line of the file
+        province_ids = self._province_ids
+        province_codes = self.province_codes
+        city_to_province = self.city_to_province
+        city_names_list = self.city_names
+        city_normalized = self.city_normalized
+        split_city_names = self._split_city_names
+
+        for line in lines:
+            line = line.strip()
+
+            # Format: 3-char code + city name
+            # e.g., "286Pozuelo de Alarcón" or "28xMadrid"
+            if len(line) < 4:
+                continue
+
+            city = line[3:].strip()
+            if not city:
+                continue
+
+            # Extract province (first 2 digits)
+            province = line[:2]
+            province_id = province_ids.get(province)
+            if province_id is None:
+                province_id = province_ids[province] = len(province_codes)
+                province_codes.append(sys.intern(province))
+            province_cities = province_to_cities[province]
+
+            # Handle entries with multiple names (e.g., "Alacant-Alicante")
+            for city_name in split_city_names(city):
+                # Add to city → province mapping (normalized names and variants
+                # come back interned, so keys are shared with later lookups)
+                normalized = normalize_city(city_name)
+                city_to_province[normalized] = province_id
+                valid_pairs.add((normalized, province_id))
+
+                city_id = name_to_id.get(city_name)
+                if city_id is None:
+                    city_id = name_to_id[city_name] = len(city_names_list)
+                    city_names_list.append(city_name)
+                    city_normalized.append(normalized)
+
+                # Share one string object per city name across the tables
+                province_cities.append(city_names_list[city_id])
+
+                # Add variants for partial matching
+                for variant in extract_city_variants(city_name):
+                    ids = variant_to_city_ids[variant]
+                    if city_id not in ids:
+                        ids.append(city_id)
+
+        # Plain dicts from here on so lookups never insert missing keys, and
+        # tuples so callers can't mutate the shared city lists
+        self.province_to_cities = {
+            province: tuple(names) for province, names in province_to_cities.items()
+        }
+        self.variant_to_city_ids = dict(variant_to_city_ids)
+
+        # A later entry with the same normalized name overrides the province,
+        # so resolve ids only after the whole file is read
+        self._valid_pairs = frozenset(valid_pairs)
+        self.city_province_ids = array(
+            "H", (city_to_province[normalized] for normalized in city_normalized)
+        )
 
     def _split_city_names(self, city: str) -> list[str]:
         """Split city entries with multiple names.
@@ -100,6 +161,10 @@ class PostalCodeValidator:
             "Donostia - San Sebastian" → ["Donostia", "San Sebastian"]
             "Hospitalet de Llobregat,l'" → ["Hospitalet de Llobregat", "l'Hospitalet de Llobregat"]
         """
+        # Every multi-name format below contains a comma or a hyphen
+        if "," not in city and "-" not in city:
+            return [city]
+
         names = []
 
         # Handle "Name,l'" format (Catalan article at end)
@@ -146,6 +211,8 @@ class PostalCodeValidator:
         Returns:
             ValidationResult with status and details
         """
+        self._ensure_loaded()
+
         # Check for missing data
         if not city or not city.strip():
             return ValidationResult(
@@ -169,58 +236,62 @@ class PostalCodeValidator:
             )
 
         province = postal_code[:2]
+        province_id = self._province_ids.get(province)
 
         # Check if province exists
-        if province not in self.province_to_cities:
+        if province_id is None:
             return ValidationResult(
                 status=ValidationStatus.INVALID,
                 message=f"Unknown province code: {province}",
                 province_code=province
             )
 
+        # Results reference the shared province string, not the fresh slice
+        province = self.province_codes[province_id]
+
         # Normalize city for lookup
         normalized_city = normalize_city(city)
 
-        # Try exact match first
-        if normalized_city in self.city_to_province:
-            expected_province = self.city_to_province[normalized_city]
-            if expected_province == province:
-                return ValidationResult(
-                    status=ValidationStatus.VALID,
-                    message="City matches postal code province",
-                    province_code=province
-                )
-            else:
-                return ValidationResult(
-                    status=ValidationStatus.INVALID,
-                    message=f"City '{city}' belongs to province {expected_province}, not {province}",
-                    province_code=province,
-                    expected_cities=self.province_to_cities.get(province, [])
-                )
+        # Try exact match first: one probe for "this name exists in this province"
+        if (normalized_city, province_id) in self._valid_pairs:
+            return ValidationResult(
+                status=ValidationStatus.VALID,
+                message="City matches postal code province",
+                province_code=province
+            )
+
+        # Known name, but not in this province
+        expected_province = self.city_to_province.get(normalized_city)
+        if expected_province is not None:
+            return ValidationResult(
+                status=ValidationStatus.INVALID,
+                message=f"City '{city}' belongs to province {self.province_codes[expected_province]}, not {province}",
+                province_code=province,
+                expected_cities=self.province_to_cities.get(province, ())
+            )
 
         # Try variant/partial match
         city_variants = extract_city_variants(city)
+        variant_to_city_ids = self.variant_to_city_ids
+        city_province_ids = self.city_province_ids
         for variant in city_variants:
-            if variant in self.variant_to_cities:
+            city_ids = variant_to_city_ids.get(variant)
+            if city_ids is not None:
                 # Found a partial match - check if any match the province
-                matching_cities = self.variant_to_cities[variant]
-                for matched_city in matching_cities:
-                    matched_normalized = normalize_city(matched_city)
-                    if matched_normalized in self.city_to_province:
-                        expected_province = self.city_to_province[matched_normalized]
-                        if expected_province == province:
-                            return ValidationResult(
-                                status=ValidationStatus.VALID,
-                                message=f"City '{city}' matches '{matched_city}' in province {province}",
-                                province_code=province
-                            )
+                for city_id in city_ids:
+                    if city_province_ids[city_id] == province_id:
+                        return ValidationResult(
+                            status=ValidationStatus.VALID,
+                            message=f"City '{city}' matches '{self.city_names[city_id]}' in province {province}",
+                            province_code=province
+                        )
 
                 # Partial match found but wrong province
                 return ValidationResult(
                     status=ValidationStatus.INVALID,
                     message=f"City '{city}' found but not in province {province}",
                     province_code=province,
-                    expected_cities=self.province_to_cities.get(province, [])
+                    expected_cities=self.province_to_cities.get(province, ())
                 )
 
         # City not found in database
@@ -228,14 +299,16 @@ class PostalCodeValidator:
             status=ValidationStatus.UNKNOWN_CITY,
             message=f"City '{city}' not found in database (province {province})",
             province_code=province,
-            expected_cities=self.province_to_cities.get(province, [])
+            expected_cities=self.province_to_cities.get(province, ())
         )
 
-    def get_cities_for_province(self, province: str) -> list[str]:
+    def get_cities_for_province(self, province: str) -> tuple[str, ...]:
         """Get all known cities for a province code."""
-        return self.province_to_cities.get(province, [])
+        self._ensure_loaded()
+        return self.province_to_cities.get(province, ())
 
     def get_province_for_city(self, city: str) -> str | None:
         """Get province code for a city name."""
-        normalized = normalize_city(city)
-        return self.city_to_province.get(normalized)
+        self._ensure_loaded()
+        province = self.city_to_province.get(normalize_city(city))
+        return None if province is None else self.province_codes[province]
@@ -4,8 +4,10 @@ Hard validation rules for Spanish addresses.
 Simple deterministic checks that don't require LLM.
 """
 
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
-from enum import Enum
+from enum import Enum, IntFlag
 
 from src.parsing.address import ParsedAddress
 
@@ -19,7 +21,7 @@ class RuleViolation(Enum):
     ONLY_NUMBERS = "only_numbers"
 
 
-@dataclass
+@dataclass(slots=True)
 class RuleResult:
     is_valid: bool
     violation: RuleViolation
@@ -29,6 +31,47 @@ class RuleResult:
 # Valid Spanish province codes: 01-52
 VALID_PROVINCE_CODES = {f"{i:02d}" for i in range(1, 53)}
 
+# Same set as a bitmap: bit i is set when province number i is valid
+_PROVINCE_MASK = sum(1 << i for i in range(1, 53))
+
+
+class Violations(IntFlag):
+    """Hard-rule violations as bit flags (priority order, lowest bit first).
+
+    fast_rule_bits returns a plain int with these bits; wrap it in
+    Violations(bits) to inspect or print it.
+    """
+
+    EMPTY_ADDRESS = 1 << 0
+    TOO_SHORT = 1 << 1
+    ONLY_NUMBERS = 1 << 2
+    INVALID_POSTCODE_FORMAT = 1 << 3
+    INVALID_POSTCODE_PROVINCE = 1 << 4
+
+
+# Plain-int values of the flags for the hot path: operators on IntFlag
+# members are Python-level methods, int operators are not
+EMPTY_BIT = Violations.EMPTY_ADDRESS.value
+TOO_SHORT_BIT = Violations.TOO_SHORT.value
+ONLY_NUMBERS_BIT = Violations.ONLY_NUMBERS.value
+POSTCODE_FORMAT_BIT = Violations.INVALID_POSTCODE_FORMAT.value
+POSTCODE_PROVINCE_BIT = Violations.INVALID_POSTCODE_PROVINCE.value
+
+# Street type keywords (Spanish, Catalan, Galician) and common abbreviations
+_STREET_KW_RE = re.compile(
+    r"\b(?:calle|avda|avenida|plaza|pza|paseo|carrer|plaça|camino|carretera|ctra"
+    r"|travesía|ronda)\b|\bc/",
+    re.IGNORECASE,
+)
+
+# Byte sets for the ASCII fast path of _scan_raw
+_ASCII_NON_ALNUM = bytes(b for b in range(128) if not chr(b).isalnum())
+_ASCII_DIGITS = b"0123456789"
+_ASCII_NON_ALPHA = bytes(b for b in range(128) if not chr(b).isalpha())
+
+# Minimum ratio of distinct characters to length (keyboard mashing repeats)
+_MIN_CHAR_VARIETY = 0.35
+
 
 def check_postcode_format(postcode: str | None) -> RuleResult:
     """Check if postcode has valid 5-digit format."""
@@ -41,7 +84,8 @@ def check_postcode_format(postcode: str | None) -> RuleResult:
 
     postcode = postcode.strip()
 
-    if not postcode.isdigit():
+    # Only ASCII 0-9 count as digits (isdigit alone accepts other scripts)
+    if not (postcode.isascii() and postcode.isdigit()):
         return RuleResult(
             is_valid=False,
             violation=RuleViolation.INVALID_POSTCODE_FORMAT,
@@ -71,22 +115,44 @@ def check_postcode_province(postcode: str | None) -> RuleResult:
             message="No postcode to check"
         )
 
-    province = postcode[:2]
-
-    if province not in VALID_PROVINCE_CODES:
+    if not _province_prefix_valid(postcode):
         return RuleResult(
             is_valid=False,
             violation=RuleViolation.INVALID_POSTCODE_PROVINCE,
-            message=f"Province code '{province}' is not valid (must be 01-52)"
+            message=f"Province code '{postcode[:2]}' is not valid (must be 01-52)"
         )
 
     return RuleResult(
         is_valid=True,
         violation=RuleViolation.NONE,
-        message=f"Valid province code: {province}"
+        message=f"Valid province code: {postcode[:2]}"
     )
 
 
+def _province_prefix_valid(postcode: str) -> bool:
+    """Whether the first two characters are ASCII digits of a valid province.
+
+    The postcode must have at least two characters.
+    """
+    # Province number from the two leading ASCII digits, tested against the bitmap
+    d0 = ord(postcode[0]) - 48
+    d1 = ord(postcode[1]) - 48
+    return 0 <= d0 <= 9 and 0 <= d1 <= 9 and bool((_PROVINCE_MASK >> (d0 * 10 + d1)) & 1)
+
+
+def postcode_province(postcode: str | None) -> int:
+    """Return the province number (1-52) of a valid postcode, or 0.
+
+    Combined format + province check: the postcode must be exactly five ASCII
+    digits (no surrounding whitespace) with a valid province prefix.
+    """
+    if not postcode or len(postcode) != 5 or not (postcode.isascii() and postcode.isdigit()):
+        return 0
+
+    province = (ord(postcode[0]) - 48) * 10 + ord(postcode[1]) - 48
+    return province if (_PROVINCE_MASK >> province) & 1 else 0
+
+
 def check_not_empty(parsed: ParsedAddress) -> RuleResult:
     """Check if address has meaningful content."""
     if not parsed.raw or not parsed.raw.strip():
@@ -128,10 +194,7 @@ def check_not_only_numbers(parsed: ParsedAddress) -> RuleResult:
     if parsed.postcode:
         text = text.replace(parsed.postcode, "")
 
-    # Remove common separators
-    text = text.replace(",", "").replace(".", "").replace("-", "").strip()
-
-    has_letters = any(c.isalpha() for c in text)
+    has_letters = _has_letter(text)
 
     if not has_letters:
         return RuleResult(
@@ -147,6 +210,22 @@ def check_not_only_numbers(parsed: ParsedAddress) -> RuleResult:
     )
 
 
+def looks_like_street_address(text: str) -> bool:
+    """Cheap check for text that is clearly a genuine street address.
+
+    Requires a street type keyword, a digit and enough character variety.
+    Used to skip the LLM nonsense check for obviously valid input.
+    """
+    if not any(c.isdigit() for c in text):
+        return False
+
+    if not _STREET_KW_RE.search(text):
+        return False
+
+    variety = len(set(text.lower())) / max(len(text), 1)
+    return variety > _MIN_CHAR_VARIETY
+
+
 def validate_hard_rules(parsed: ParsedAddress) -> list[RuleResult]:
     """Run all hard validation rules on a parsed address.
 
@@ -163,7 +242,118 @@ def validate_hard_rules(parsed: ParsedAddress) -> list[RuleResult]:
     return results
 
 
-def get_violations(parsed: ParsedAddress) -> list[RuleResult]:
+def _has_letter(text: str) -> bool:
+    """Whether text contains any letter, scanning ASCII text in C."""
+    if text.isascii():
+        return bool(text.encode("ascii").translate(None, _ASCII_NON_ALPHA))
+    return any(c.isalpha() for c in text)
+
+
+def _scan_raw(raw: str) -> tuple[int, bool]:
+    """Count alphanumeric characters and detect letters in one pass."""
+    if raw.isascii():
+        # Strip non-alphanumerics (then digits) in C instead of looping per char
+        alnum = raw.encode("ascii").translate(None, _ASCII_NON_ALNUM)
+        return len(alnum), bool(alnum.translate(None, _ASCII_DIGITS))
+
+    meaningful = 0
+    has_letter = False
+    for c in raw:
+        if c.isalnum():
+            meaningful += 1
+            if not has_letter and c.isalpha():
+                has_letter = True
+    return meaningful, has_letter
+
+
+def fast_rule_bits(parsed: ParsedAddress, min_chars: int = 5) -> int:
+    """Run all hard rules and return the violations as a bitmask.
+
+    Same rules as validate_hard_rules, but a single scan over the raw text and
+    no allocations on the common no-violation path. Returns 0 when every rule
+    passes; otherwise the *_BIT flags of the failed rules are set.
+    """
+    raw = parsed.raw
+    postcode = parsed.postcode
+    bits = 0
+
+    if not raw or raw.isspace():
+        bits |= EMPTY_BIT
+
+    meaningful, has_letter = _scan_raw(raw)
+    if meaningful < min_chars:
+        bits |= TOO_SHORT_BIT
+
+    # Letters inside the postcode don't count (only matters if it has any)
+    if has_letter and postcode and not postcode.isdigit():
+        has_letter = _has_letter(raw.replace(postcode, ""))
+    if not has_letter:
+        bits |= ONLY_NUMBERS_BIT
+
+    # Well-formed postcodes (the common case) pass both postcode rules at once
+    if postcode and not postcode_province(postcode):
+        stripped = postcode.strip()
+        if len(stripped) != 5 or not (stripped.isascii() and stripped.isdigit()):
+            bits |= POSTCODE_FORMAT_BIT
+
+        if len(postcode) >= 2 and not _province_prefix_valid(postcode):
+            bits |= POSTCODE_PROVINCE_BIT
+
+    return bits
+
+
+def _postcode_format_message(parsed: ParsedAddress, min_chars: int) -> str:
+    postcode = parsed.postcode.strip()
+    if not (postcode.isascii() and postcode.isdigit()):
+        return f"Postcode '{postcode}' contains non-numeric characters"
+    return f"Postcode '{postcode}' must be exactly 5 digits"
+
+
+# Failure messages, built only for rules that actually failed. They match
+# the messages of the corresponding check_* functions and take the same
+# min_chars that fast_rule_bits was called with.
+_MSG_TEMPLATES: dict[RuleViolation, Callable[[ParsedAddress, int], str]] = {
+    RuleViolation.EMPTY_ADDRESS: lambda parsed, min_chars: "Address is empty",
+    RuleViolation.TOO_SHORT: lambda parsed, min_chars: (
+        f"Address too short ({_scan_raw(parsed.raw)[0]} chars, minimum {min_chars})"
+    ),
+    RuleViolation.ONLY_NUMBERS: lambda parsed, min_chars: "Address contains only numbers",
+    RuleViolation.INVALID_POSTCODE_FORMAT: _postcode_format_message,
+    RuleViolation.INVALID_POSTCODE_PROVINCE: lambda parsed, min_chars: (
+        f"Province code '{parsed.postcode[:2]}' is not valid (must be 01-52)"
+    ),
+}
+
+# Bit → violation it reports, in priority order
+_BIT_TO_VIOLATION = (
+    (EMPTY_BIT, RuleViolation.EMPTY_ADDRESS),
+    (TOO_SHORT_BIT, RuleViolation.TOO_SHORT),
+    (ONLY_NUMBERS_BIT, RuleViolation.ONLY_NUMBERS),
+    (POSTCODE_FORMAT_BIT, RuleViolation.INVALID_POSTCODE_FORMAT),
+    (POSTCODE_PROVINCE_BIT, RuleViolation.INVALID_POSTCODE_PROVINCE),
+)
+
+
+def violations_from_bits(
+    parsed: ParsedAddress, bits: int, min_chars: int = 5
+) -> list[RuleResult]:
+    """Materialize RuleResults (with messages) for the bits set by fast_rule_bits.
+
+    min_chars must match the value fast_rule_bits was called with.
+    """
+    if not bits:
+        return []
+    return [
+        RuleResult(
+            is_valid=False,
+            violation=violation,
+            message=_MSG_TEMPLATES[violation](parsed, min_chars),
+        )
+        for bit, violation in _BIT_TO_VIOLATION
+        if bits & bit
+    ]
+
+
+def get_violations(parsed: ParsedAddress, min_chars: int = 5) -> list[RuleResult]:
     """Get only the failed rules for a parsed address."""
-    all_results = validate_hard_rules(parsed)
-    return [r for r in all_results if not r.is_valid]
+    return violations_from_bits(parsed, fast_rule_bits(parsed, min_chars), min_chars)
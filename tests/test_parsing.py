@@ -2,9 +2,16 @@
 Unit tests for address parsing.
 """
 
+import dataclasses
+
 import pytest
 
-from src.parsing.address import parse, parse_or_use_existing, ParsedAddress
+from src.parsing.address import (
+    parse,
+    parse_or_use_existing,
+    ParsedAddress,
+    _parse_cached,
+)
 
 
 class TestBasicParsing:
@@ -133,3 +140,38 @@ class TestParseOrUseExisting:
         )
         assert result.city == "Madrid"
         assert result.postcode == "28013"
+
+
+class TestParseCache:
+    """Test memoization of libpostal results."""
+
+    def setup_method(self):
+        _parse_cached.cache_clear()
+
+    def test_repeated_address_hits_cache(self):
+        parse("Calle Serrano 110, Madrid 28006")
+        parse("  Calle Serrano 110, Madrid 28006  ")
+        info = _parse_cached.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_cached_results_are_independent(self):
+        first = parse_or_use_existing("Calle Serrano 110, Madrid 28006", city="Getafe")
+        second = parse("Calle Serrano 110, Madrid 28006")
+        assert first.city == "Getafe"
+        assert second.city == "madrid"
+
+    def test_no_overrides_returns_cached_result(self):
+        raw = "Calle Serrano 110, Madrid 28006"
+        assert parse_or_use_existing(raw, city="  ", postcode="") is parse(raw)
+
+    def test_parsed_address_is_immutable(self):
+        parsed = parse("Calle Serrano 110, Madrid 28006")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            parsed.city = "Getafe"
+
+    def test_overrides_keep_other_fields(self):
+        raw = "Calle Serrano 110, Madrid 28006"
+        overridden = parse_or_use_existing(raw, city="Getafe", postcode="28901")
+        expected = dataclasses.replace(parse(raw), city="Getafe", postcode="28901")
+        assert overridden == expected
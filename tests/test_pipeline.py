@@ -0,0 +1,275 @@
+"""
+Unit tests for the address validation pipeline.
+
+The LLM reviewer is replaced by a deterministic fake, so these tests exercise
+how the pipeline drives its stages without loading a model.
+"""
+
+import csv
+
+import pytest
+from pathlib import Path
+
+from src.llm.reviewer import AddressIntent, CityValidationResult, NonsenseResult
+from src.pipeline import AddressPipeline, AddressStatus
+
+
+class FakeReviewer:
+    """Stand-in for AddressReviewer that records every request."""
+
+    def __init__(self, gibberish=(), valid_cities=()):
+        self.gibberish = {text.lower() for text in gibberish}
+        self.valid_cities = {city.lower() for city in valid_cities}
+        self.nonsense_calls: list[str] = []
+        self.city_calls: list[tuple[str, str]] = []
+        self.nonsense_batches: list[int] = []
+
+    def check_nonsense(self, address: str) -> NonsenseResult:
+        self.nonsense_calls.append(address)
+        if address.lower() in self.gibberish:
+            return NonsenseResult(AddressIntent.GIBBERISH, "high", "fake gibberish")
+        return NonsenseResult(AddressIntent.VALID_ATTEMPT, "high", "fake valid")
+
+    def validate_city(self, city, postcode, province_cities) -> CityValidationResult:
+        self.city_calls.append((city, postcode))
+        if city.lower() in self.valid_cities:
+            return CityValidationResult(True, city.title(), "fake known city")
+        return CityValidationResult(False, None, "fake unknown city")
+
+    def check_nonsense_batch(self, addresses):
+        self.nonsense_batches.append(len(addresses))
+        return [self.check_nonsense(address) for address in addresses]
+
+    def validate_city_batch(self, items):
+        return [self.validate_city(*item) for item in items]
+
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TEST_ADDRESSES = PROJECT_ROOT / "data" / "processed" / "test_addresses.csv"
+
+# Row whose street needs the nonsense check and whose city then needs the
+# city check, so it yields two LLM tasks one after the other
+TWO_PHASE_ROW = ["Kalea Berria 7", "Villaquimera", "28013"]
+
+
+@pytest.fixture
+def reference_dir():
+    """Path to the postal code reference data."""
+    return PROJECT_ROOT / "data" / "reference" / "postal-codes"
+
+
+def make_reviewer():
+    return FakeReviewer(
+        gibberish=["AAAAAAA BBBBBBB CCCCCC", "asdfgh jklñ qwerty"],
+        valid_cities=["Villaquimera"],
+    )
+
+
+def make_pipeline(reference_dir, reviewer, use_llm=True):
+    pipeline = AddressPipeline(reference_dir, use_llm=use_llm)
+    pipeline._llm_reviewer = reviewer
+    return pipeline
+
+
+@pytest.fixture
+def input_csv(tmp_path):
+    """The repo's test addresses with a two-phase row in the middle."""
+    with open(TEST_ADDRESSES, encoding="utf-8", newline="") as f:
+        rows = list(csv.reader(f))
+    header, body = rows[0], rows[1:]
+
+    two_phase = TWO_PHASE_ROW + [""] * (len(header) - len(TWO_PHASE_ROW))
+    body.insert(len(body) // 2, two_phase)
+
+    path = tmp_path / "input.csv"
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        csv.writer(f).writerows([header] + body)
+    return path
+
+
+def run_csv(pipeline, input_path, output_path, **kwargs):
+    """Run process_csv and return (stats, output rows without the header)."""
+    stats = pipeline.process_csv(input_path, output_path, **kwargs)
+    with open(output_path, encoding="utf-8", newline="") as f:
+        return stats, list(csv.reader(f))[1:]
+
+
+class TestNonsenseWithConfirmedCity:
+    """A valid city/postcode pair must not let a gibberish street through."""
+
+    @pytest.mark.parametrize("address,city,postcode", [
+        ("AAAAAAA BBBBBBB CCCCCC", "Madrid", "28013"),
+        ("asdfgh jklñ qwerty", "Barcelona", "08001"),
+    ])
+    def test_gibberish_rows_reach_llm(self, reference_dir, address, city, postcode):
+        reviewer = FakeReviewer(gibberish=[address])
+        result = make_pipeline(reference_dir, reviewer).validate(address, city, postcode)
+
+        assert len(reviewer.nonsense_calls) == 1
+        assert result.status == AddressStatus.NONSENSE
+
+    def test_number_without_street_keyword_reaches_llm(self, reference_dir):
+        reviewer = FakeReviewer(gibberish=["qwerty", "qwerty 12"])
+        result = make_pipeline(reference_dir, reviewer).validate("qwerty 12", "Madrid", "28013")
+
+        assert reviewer.nonsense_calls
+        assert result.status == AddressStatus.NONSENSE
+
+    def test_obvious_street_skips_llm(self, reference_dir):
+        reviewer = FakeReviewer()
+        result = make_pipeline(reference_dir, reviewer).validate(
+            "Calle Gran Vía 32", "Madrid", "28013"
+        )
+
+        assert reviewer.nonsense_calls == []
+        assert result.status == AddressStatus.VALID
+        assert result.llm_intent == AddressIntent.VALID_ATTEMPT.value
+        assert result.llm_confidence == "high"
+
+
+class TestTwoPhaseRow:
+    """Rows that need a nonsense check and then a city check."""
+
+    def test_validate_runs_both_llm_checks(self, reference_dir):
+        reviewer = make_reviewer()
+        result = make_pipeline(reference_dir, reviewer).validate(*TWO_PHASE_ROW)
+
+        assert len(reviewer.nonsense_calls) == 1
+        assert reviewer.city_calls == [("Villaquimera", "28013")]
+        assert result.status == AddressStatus.VALID_NORMALIZED
+
+    def test_process_csv_runs_both_llm_checks(self, reference_dir, input_csv, tmp_path):
+        reviewer = make_reviewer()
+        _, rows = run_csv(
+            make_pipeline(reference_dir, reviewer), input_csv, tmp_path / "out.csv",
+            batch_size=4,
+        )
+
+        row = next(row for row in rows if row[:3] == TWO_PHASE_ROW)
+        assert ("Villaquimera", "28013") in reviewer.city_calls
+        assert row[5] == AddressStatus.VALID_NORMALIZED.value
+
+
+class TestProcessCsvBatching:
+    """Batching LLM tasks across rows must not change the output."""
+
+    def test_batch_size_does_not_change_output(self, reference_dir, input_csv, tmp_path):
+        expected = run_csv(
+            make_pipeline(reference_dir, make_reviewer()), input_csv, tmp_path / "b1.csv",
+            batch_size=1,
+        )
+        for batch_size in (2, 5, 32):
+            actual = run_csv(
+                make_pipeline(reference_dir, make_reviewer()), input_csv,
+                tmp_path / f"b{batch_size}.csv", batch_size=batch_size,
+            )
+            assert actual == expected
+
+    def test_batched_output_matches_validate(self, reference_dir, input_csv, tmp_path):
+        pipeline = make_pipeline(reference_dir, make_reviewer())
+        _, rows = run_csv(pipeline, input_csv, tmp_path / "out.csv", batch_size=8)
+
+        statuses = [row[5] for row in rows]
+        expected = [pipeline.validate(*row[:3]).status.value for row in rows]
+        assert statuses == expected
+
+    def test_output_order_preserved(self, reference_dir, input_csv, tmp_path):
+        with open(input_csv, encoding="utf-8", newline="") as f:
+            input_rows = list(csv.reader(f))[1:]
+
+        _, rows = run_csv(
+            make_pipeline(reference_dir, make_reviewer()), input_csv, tmp_path / "out.csv",
+            batch_size=3,
+        )
+        assert [row[:len(input_rows[0])] for row in rows] == input_rows
+
+    def test_final_partial_window_flushed(self, reference_dir, input_csv, tmp_path):
+        reviewer = make_reviewer()
+        stats, rows = run_csv(
+            make_pipeline(reference_dir, reviewer), input_csv, tmp_path / "out.csv",
+            batch_size=1000,
+        )
+
+        # Far fewer LLM tasks than batch_size, so every row waits for the end
+        assert reviewer.nonsense_calls
+        assert len(rows) == stats["total"] == sum(1 for _ in open(input_csv)) - 1
+        assert "unknown" not in {row[5] for row in rows}
+
+    def test_limit_flushes_partial_window(self, reference_dir, input_csv, tmp_path):
+        stats, rows = run_csv(
+            make_pipeline(reference_dir, make_reviewer()), input_csv, tmp_path / "out.csv",
+            batch_size=1000, limit=7,
+        )
+        assert len(rows) == stats["total"] == 7
+
+    def test_window_bounded_between_llm_rows(self, reference_dir, tmp_path):
+        # Two rows needing the LLM, far apart, with batch_size 2: without a
+        # cap on the window every row in between would wait for the second
+        input_path = tmp_path / "input.csv"
+        rows = (
+            [["Kalea Berria 7", "Madrid", "28013"]]
+            + [["Calle Gran Vía 32", "Madrid", "28013"]] * 20
+            + [["Kalea Nagusia 5", "Madrid", "28013"]]
+        )
+        with open(input_path, "w", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerows([["address", "city", "zip"]] + rows)
+
+        reviewer = make_reviewer()
+        stats, output = run_csv(
+            make_pipeline(reference_dir, reviewer), input_path, tmp_path / "out.csv",
+            batch_size=2,
+        )
+
+        assert reviewer.nonsense_batches == [1, 1]
+        assert [row[:3] for row in output] == rows
+        assert stats["total"] == len(rows)
+
+
+class TestProcessCsvWorkers:
+    """Worker processes must not change the output."""
+
+    def test_workers_without_llm(self, reference_dir, input_csv, tmp_path):
+        expected = run_csv(
+            make_pipeline(reference_dir, None, use_llm=False), input_csv,
+            tmp_path / "w1.csv", workers=1,
+        )
+        actual = run_csv(
+            make_pipeline(reference_dir, None, use_llm=False), input_csv,
+            tmp_path / "w2.csv", workers=2, chunk_size=5,
+        )
+        assert actual == expected
+
+    def test_workers_with_llm(self, reference_dir, input_csv, tmp_path):
+        expected = run_csv(
+            make_pipeline(reference_dir, make_reviewer()), input_csv,
+            tmp_path / "w1.csv", workers=1, batch_size=4,
+        )
+        actual = run_csv(
+            make_pipeline(reference_dir, make_reviewer()), input_csv,
+            tmp_path / "w2.csv", workers=2, chunk_size=5, batch_size=4,
+        )
+        assert actual == expected
+
+
+class TestProcessCsvErrors:
+    """Rows written before a failure must reach the output file."""
+
+    def test_buffered_rows_flushed_on_error(self, reference_dir, input_csv, tmp_path):
+        class FailingReviewer(FakeReviewer):
+            def validate_city(self, city, postcode, province_cities):
+                raise RuntimeError("model crashed")
+
+        output_path = tmp_path / "out.csv"
+        with pytest.raises(RuntimeError):
+            make_pipeline(reference_dir, FailingReviewer()).process_csv(
+                input_csv, output_path, batch_size=1
+            )
+
+        with open(input_csv, encoding="utf-8", newline="") as f:
+            input_rows = list(csv.reader(f))[1:]
+        with open(output_path, encoding="utf-8", newline="") as f:
+            rows = list(csv.reader(f))[1:]
+
+        # Everything before the two-phase row (the first city check) was written
+        failed_at = next(i for i, row in enumerate(input_rows) if row[:3] == TWO_PHASE_ROW)
+        assert [row[:len(input_rows[0])] for row in rows] == input_rows[:failed_at]
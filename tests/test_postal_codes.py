@@ -140,3 +140,28 @@ class TestMissingData:
     def test_whitespace_city(self, validator):
         result = validator.validate("   ", "28013")
         assert result.status == ValidationStatus.MISSING_DATA
+
+
+class TestLazyLoading:
+    """Reference data is only read on first use."""
+
+    def test_construction_does_not_read_files(self, tmp_path):
+        PostalCodeValidator(tmp_path / "missing")
+
+    def test_first_lookup_loads_data(self, validator):
+        assert validator.city_to_province == {}
+        assert validator.get_province_for_city("Madrid") == "28"
+        assert validator.city_to_province
+
+
+class TestDuplicateCityNames:
+    """A city name that exists in more than one province."""
+
+    def test_valid_in_every_province(self, tmp_path):
+        (tmp_path / "codciu.txt").write_text(
+            "05xVillanueva\n06xVillanueva\n28xMadrid\n", encoding="utf-8"
+        )
+        validator = PostalCodeValidator(tmp_path)
+        assert validator.validate("Villanueva", "05001").status == ValidationStatus.VALID
+        assert validator.validate("Villanueva", "06001").status == ValidationStatus.VALID
+        assert validator.validate("Villanueva", "28001").status == ValidationStatus.INVALID
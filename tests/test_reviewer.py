@@ -0,0 +1,141 @@
+"""
+Unit tests for the LLM reviewer's prompt handling.
+
+The model, tokenizer and Outlines model are stubbed, so these tests cover the
+checks around the cached prompt prefix without loading a model.
+"""
+
+import types
+
+import pytest
+
+from src.llm import reviewer as reviewer_module
+from src.llm.reviewer import AddressIntent, AddressReviewer
+
+
+class PassthroughAdapter:
+    """Type adapter that sends text prompts to mlx-lm as is (outlines 1.2.9)."""
+
+    def format_input(self, model_input):
+        return model_input
+
+
+class ChatTemplateAdapter:
+    """Type adapter that wraps text prompts in a chat template (outlines >= 1.2.10)."""
+
+    def format_input(self, model_input):
+        return f"<|im_start|>user\n{model_input}<|im_end|>\n<|im_start|>assistant\n"
+
+
+def stub_reviewer(adapter):
+    reviewer = AddressReviewer()
+    reviewer._outlines_model = types.SimpleNamespace(type_adapter=adapter)
+    return reviewer
+
+
+class TestPromptPassthrough:
+    """The prompt cache requires Outlines to leave text prompts untouched."""
+
+    def test_passthrough_adapter_accepted(self):
+        stub_reviewer(PassthroughAdapter())._check_prompt_passthrough()
+
+    def test_chat_template_adapter_rejected(self):
+        with pytest.raises(ValueError, match="chat template"):
+            stub_reviewer(ChatTemplateAdapter())._check_prompt_passthrough()
+
+    def test_load_fails_before_building_caches(self, monkeypatch):
+        monkeypatch.setattr(reviewer_module, "load", lambda path: (object(), object()))
+        monkeypatch.setattr(
+            reviewer_module.outlines,
+            "from_mlxlm",
+            lambda model, tokenizer: types.SimpleNamespace(type_adapter=ChatTemplateAdapter()),
+        )
+
+        reviewer = AddressReviewer()
+        with pytest.raises(ValueError, match="chat template"):
+            reviewer._ensure_loaded()
+        assert reviewer._nonsense_cache is None
+        assert reviewer._city_cache is None
+
+
+class CharTokenizer:
+    """One token per character, optionally with a BOS token and merged "ab" pairs."""
+
+    def __init__(self, bos=False, merge_ab=False):
+        self.bos = bos
+        self.merge_ab = merge_ab
+
+    def encode(self, text, add_special_tokens=True):
+        tokens = ["<s>"] if self.bos and add_special_tokens else []
+        i = 0
+        while i < len(text):
+            if self.merge_ab and text.startswith("ab", i):
+                tokens.append("ab")
+                i += 2
+            else:
+                tokens.append(text[i])
+                i += 1
+        return tokens
+
+
+def split_reviewer(tokenizer):
+    reviewer = AddressReviewer()
+    reviewer._tokenizer = tokenizer
+    reviewer._prompt_prefix = "<user>"
+    reviewer._prompt_suffix = "</user>"
+    return reviewer
+
+
+class TestPromptSplit:
+    """Cached prefix + per-call text must tokenize like the full prompt."""
+
+    def test_clean_split_accepted(self):
+        split_reviewer(CharTokenizer())._check_prompt_split("Instructions\n\n", "Address: x")
+
+    def test_token_across_split_rejected(self):
+        with pytest.raises(ValueError, match="merges tokens"):
+            split_reviewer(CharTokenizer(merge_ab=True))._check_prompt_split("xa", "b")
+
+    def test_special_tokens_on_continuation_rejected(self):
+        with pytest.raises(ValueError, match="special tokens"):
+            split_reviewer(CharTokenizer(bos=True))._check_prompt_split("x", "y")
+
+
+def generating_reviewer(monkeypatch, output):
+    """Reviewer whose generator returns a fixed output."""
+    reviewer = AddressReviewer()
+    monkeypatch.setattr(reviewer, "_ensure_loaded", lambda: None)
+    monkeypatch.setattr(reviewer, "_generate", lambda *args: output)
+    return reviewer
+
+
+class TestTruncatedOutput:
+    """Answers cut off by the token budget must not abort processing."""
+
+    def test_complete_nonsense_output(self, monkeypatch):
+        reviewer = generating_reviewer(monkeypatch, "gibberish|high|keyboard mashing")
+        result = reviewer.check_nonsense("asdfgh")
+        assert result.intent == AddressIntent.GIBBERISH
+        assert result.explanation == "keyboard mashing"
+
+    @pytest.mark.parametrize("output", ["gibberi", "gibberish|hi", "gibberish|high"])
+    def test_truncated_nonsense_output(self, monkeypatch, output):
+        result = generating_reviewer(monkeypatch, output).check_nonsense("asdfgh")
+        assert result.intent == AddressIntent.VALID_ATTEMPT
+        assert result.confidence == "low"
+
+    def test_complete_city_output(self, monkeypatch):
+        output = '{"is_valid": true, "normalized_city": "Sevilla", "reason": "variant"}'
+        result = generating_reviewer(monkeypatch, output).validate_city(
+            "Seville", "41001", ["Sevilla"]
+        )
+        assert result.is_valid
+        assert result.normalized_city == "Sevilla"
+
+    def test_truncated_city_output(self, monkeypatch):
+        output = '{"is_valid": true, "normalized_city": "Sevilla", "reason": "Variante en ingl'
+        result = generating_reviewer(monkeypatch, output).validate_city(
+            "Seville", "41001", ["Sevilla"]
+        )
+        assert not result.is_valid
+        assert result.normalized_city is None
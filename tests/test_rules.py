@@ -6,14 +6,21 @@ import pytest
 
 from src.parsing.address import ParsedAddress
 from src.validation.rules import (
+    EMPTY_BIT,
+    POSTCODE_PROVINCE_BIT,
+    TOO_SHORT_BIT,
     check_postcode_format,
     check_postcode_province,
     check_not_empty,
     check_minimum_length,
     check_not_only_numbers,
+    fast_rule_bits,
+    looks_like_street_address,
+    postcode_province,
     validate_hard_rules,
     get_violations,
     RuleViolation,
+    Violations,
 )
 
 
@@ -145,6 +152,28 @@ class TestNotOnlyNumbers:
         assert not result.is_valid
 
 
+class TestLooksLikeStreetAddress:
+    """Test the deterministic pre-filter for obviously valid addresses."""
+
+    def test_street_with_number(self):
+        assert looks_like_street_address("Calle Gran Vía 32, Madrid")
+
+    def test_abbreviated_street(self):
+        assert looks_like_street_address("c/ Serrano 110, bajo")
+
+    def test_no_street_keyword(self):
+        assert not looks_like_street_address("asdfgh jklñ 12345")
+
+    def test_no_number(self):
+        assert not looks_like_street_address("Calle Mayor")
+
+    def test_repetitive_text(self):
+        assert not looks_like_street_address("calle calle calle calle calle 1")
+
+    def test_keyword_required(self):
+        assert not looks_like_street_address("qwerty 12")
+
+
 class TestValidateHardRules:
     """Test combined validation."""
 
@@ -171,3 +200,71 @@ class TestValidateHardRules:
         )
         violations = get_violations(parsed)
         assert len(violations) >= 2  # Too short + invalid province
+
+
+class TestFastRuleBits:
+    """Test the bitmask form of the hard rules."""
+
+    def test_valid_address_has_no_bits(self):
+        parsed = ParsedAddress(
+            raw="Calle Gran Vía 32, Madrid, 28013",
+            postcode="28013"
+        )
+        assert fast_rule_bits(parsed) == 0
+
+    def test_empty_address(self):
+        bits = fast_rule_bits(ParsedAddress(raw=""))
+        assert bits & EMPTY_BIT
+        assert bits & TOO_SHORT_BIT
+
+    def test_bits_decode_as_flags(self):
+        flags = Violations(fast_rule_bits(ParsedAddress(raw="")))
+        assert flags == Violations.EMPTY_ADDRESS | Violations.TOO_SHORT | Violations.ONLY_NUMBERS
+
+    def test_matches_get_violations(self):
+        parsed = ParsedAddress(raw="AB", postcode="99999")
+        bits = fast_rule_bits(parsed)
+        assert bits & TOO_SHORT_BIT
+        assert bits & POSTCODE_PROVINCE_BIT
+        assert len(get_violations(parsed)) == bin(bits).count("1")
+
+    def test_violation_messages_match_checks(self):
+        parsed = ParsedAddress(raw="12", postcode="9x001")
+        expected = [
+            r for r in validate_hard_rules(parsed) if not r.is_valid
+        ]
+        assert get_violations(parsed) == expected
+
+    def test_violations_in_priority_order(self):
+        # The pipeline takes its status from the first violation
+        violations = get_violations(ParsedAddress(raw="", postcode="99x"))
+        assert [v.violation for v in violations] == [
+            RuleViolation.EMPTY_ADDRESS,
+            RuleViolation.TOO_SHORT,
+            RuleViolation.ONLY_NUMBERS,
+            RuleViolation.INVALID_POSTCODE_FORMAT,
+            RuleViolation.INVALID_POSTCODE_PROVINCE,
+        ]
+
+    def test_too_short_message_uses_min_chars(self):
+        parsed = ParsedAddress(raw="Calle 1")
+        violations = get_violations(parsed, min_chars=10)
+        expected = check_minimum_length(parsed, min_chars=10)
+        assert [v.message for v in violations] == [expected.message]
+
+
+class TestPostcodeProvinceNumber:
+    """Test the combined postcode format + province check."""
+
+    def test_valid_postcode(self):
+        assert postcode_province("28013") == 28
+        assert postcode_province("08001") == 8
+
+    def test_invalid_province(self):
+        assert postcode_province("99999") == 0
+        assert postcode_province("00000") == 0
+
+    def test_invalid_format(self):
+        assert postcode_province("2801") == 0
+        assert postcode_province("28O13") == 0
+        assert postcode_province(None) == 0